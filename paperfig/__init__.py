@@ -2,9 +2,17 @@ from __future__ import annotations
 
 __all__ = ["__version__"]
 
-try:
-    from importlib.metadata import version
 
-    __version__ = version("paperfigg")
-except Exception:
-    __version__ = "0.4.0"
+def __getattr__(name: str) -> str:
+    # Resolved on first access: importlib.metadata is slow to import and most
+    # subpackage imports never need the version.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from importlib.metadata import version
+
+        value = version("paperfigg")
+    except Exception:
+        value = "0.4.0"
+    globals()["__version__"] = value
+    return value
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import json
-import time
-from dataclasses import asdict
+import os
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+from paperfig.plugins.base import CritiqueRulePlugin
 from paperfig.plugins.registry import resolve_enabled_critique_plugins
-from paperfig.critique.rules.base import RuleContext
-from paperfig.templates.loader import load_template_catalog
+from paperfig.critique.rules.base import RuleContext, RuleEvaluator
+from paperfig.templates.loader import discover_template_files, load_template_catalog
+from paperfig.utils.jsoncache import read_json_cached
 from paperfig.utils.prompts import load_prompt
-from paperfig.utils.types import ArchitectureCritiqueReport
+from paperfig.utils.timestamps import utc_now_iso
+from paperfig.utils.types import ArchitectureCritiqueFinding, ArchitectureCritiqueReport
 
 
 SEVERITY_ORDER = {
@@ -19,6 +21,48 @@ SEVERITY_ORDER = {
     "major": 2,
     "critical": 3,
 }
+SEVERITY_NAMES = ", ".join(SEVERITY_ORDER)
+_SEVERITY_NAME: Dict[int, str] = {rank: name for name, rank in SEVERITY_ORDER.items()}
+
+
+@lru_cache(maxsize=32)
+def _resolve_rules_cached(enabled_rules: Optional[Tuple[str, ...]]) -> Tuple[CritiqueRulePlugin, ...]:
+    # The built-in rule registry is static, so each distinct selection only needs resolving once.
+    return tuple(resolve_enabled_critique_plugins(enabled_rules))
+
+
+@lru_cache(maxsize=32)
+def _resolve_evaluators_cached(enabled_rules: Optional[Tuple[str, ...]]) -> Tuple[RuleEvaluator, ...]:
+    # Critique only needs the callables; plugin descriptors stay with available_rules().
+    return tuple(plugin.evaluator for plugin in _resolve_rules_cached(enabled_rules))
+
+
+def _load_template_ids(template_dir: Path, template_pack: str) -> FrozenSet[str]:
+    try:
+        catalog = load_template_catalog(template_dir=template_dir, pack_id=template_pack, pack=template_pack)
+    except Exception:
+        return frozenset()
+    return frozenset(template.template_id for template in catalog.templates)
+
+
+@lru_cache(maxsize=8)
+def _template_ids_cached(
+    template_dir: str,
+    template_pack: str,
+    files_stamp: Tuple[Tuple[str, int, int], ...],
+) -> FrozenSet[str]:
+    del files_stamp
+    return _load_template_ids(Path(template_dir), template_pack)
+
+
+def _template_ids(template_dir: Path, template_pack: str) -> FrozenSet[str]:
+    # Shared by every agent in the process (rerun builds a fresh one) while the pack's files are unchanged.
+    try:
+        paths, _, _ = discover_template_files(template_dir=template_dir, pack=template_pack)
+        stamp = tuple((str(path), stat.st_mtime_ns, stat.st_size) for path in paths for stat in (os.stat(path),))
+    except Exception:
+        return _load_template_ids(template_dir, template_pack)
+    return _template_ids_cached(str(template_dir), template_pack, stamp)
 
 
 class ArchitectureCriticAgent:
@@ -30,11 +74,12 @@ class ArchitectureCriticAgent:
     ) -> None:
         self.prompt = load_prompt("critique_architecture.txt")
         self.repo_root = repo_root
+        self.flows_root = repo_root / "docs" / "architecture" / "flows"
         self.template_dir = template_dir
         self.default_template_pack = default_template_pack
 
     def available_rules(self) -> List[dict]:
-        rules = resolve_enabled_critique_plugins(None)
+        rules = _resolve_rules_cached(None)
         return [
             {
                 "rule_id": plugin.descriptor.plugin_id.split(".", 1)[-1],
@@ -56,7 +101,6 @@ class ArchitectureCriticAgent:
         plan_data = self._read_json(run_dir / "plan.json")
         docs_drift_report = self._read_json(run_dir / "docs_drift_report.json")
 
-        valid_template_ids = self._resolve_valid_template_ids(run_metadata)
         context = RuleContext(
             run_dir=run_dir,
             repo_root=self.repo_root,
@@ -64,14 +108,19 @@ class ArchitectureCriticAgent:
             inspect_data=inspect_data if isinstance(inspect_data, dict) else None,
             plan_data=plan_data if isinstance(plan_data, list) else None,
             docs_drift_report=docs_drift_report if isinstance(docs_drift_report, dict) else None,
-            valid_template_ids=valid_template_ids,
+            flows_root=self.flows_root,
+            template_ids_loader=partial(self._resolve_valid_template_ids, run_metadata),
         )
 
         findings = []
-        for plugin in resolve_enabled_critique_plugins(enabled_rules):
-            findings.extend(plugin.evaluator(context))
-
-        max_seen = max((SEVERITY_ORDER.get(item.severity, 0) for item in findings), default=0)
+        for evaluate in _resolve_evaluators_cached(tuple(enabled_rules) if enabled_rules else None):
+            findings.extend(evaluate(context))
+
+        max_seen = 0
+        for item in findings:
+            rank = SEVERITY_ORDER.get(item.severity, 0)
+            if rank > max_seen:
+                max_seen = rank
         blocked = max_seen >= SEVERITY_ORDER.get(block_severity, SEVERITY_ORDER["critical"])
 
         summary = "No architecture findings."
@@ -81,43 +130,45 @@ class ArchitectureCriticAgent:
         return ArchitectureCritiqueReport(
             run_id=run_id,
             block_severity=block_severity,
-            findings=list(findings),
+            findings=findings,
             blocked=blocked,
             summary=summary,
-            generated_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            generated_at=utc_now_iso(),
         )
 
-    def _resolve_valid_template_ids(self, run_metadata: object) -> Set[str]:
+    def _resolve_valid_template_ids(self, run_metadata: object) -> FrozenSet[str]:
         if not isinstance(run_metadata, dict):
-            return set()
-
+            return frozenset()
         template_pack = str(run_metadata.get("template_pack", self.default_template_pack))
-        try:
-            catalog = load_template_catalog(
-                template_dir=self.template_dir,
-                pack_id=template_pack,
-                pack=template_pack,
-            )
-        except Exception:
-            return set()
-        return {template.template_id for template in catalog.templates}
+        return _template_ids(self.template_dir, template_pack)
 
     @staticmethod
     def _read_json(path: Path) -> object:
-        if not path.exists():
-            return None
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
+        return read_json_cached(path)
 
     @staticmethod
     def _severity_name(value: int) -> str:
-        for name, rank in SEVERITY_ORDER.items():
-            if rank == value:
-                return name
-        return "info"
+        return _SEVERITY_NAME.get(value, "info")
+
+
+def _finding_to_dict(finding: ArchitectureCritiqueFinding) -> Dict[str, object]:
+    return {
+        "finding_id": finding.finding_id,
+        "severity": finding.severity,
+        "title": finding.title,
+        "description": finding.description,
+        "evidence": finding.evidence,
+        "suggestion": finding.suggestion,
+    }
 
 
 def report_to_dict(report: ArchitectureCritiqueReport) -> Dict[str, object]:
-    return asdict(report)
+    # Equivalent to dataclasses.asdict without its recursive deepcopy; findings hold only strings.
+    return {
+        "run_id": report.run_id,
+        "block_severity": report.block_severity,
+        "findings": [_finding_to_dict(finding) for finding in report.findings],
+        "blocked": report.blocked,
+        "summary": report.summary,
+        "generated_at": report.generated_at,
+    }
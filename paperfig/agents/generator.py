@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from paperfig.utils.fastjson import dumps_indented
 from paperfig.utils.paperbanana import PaperBananaClient
 from paperfig.utils.traceability import build_traceability, write_traceability
 from paperfig.utils.types import FigureCandidate, FigurePlan, PaperContent
@@ -34,9 +34,8 @@ class GeneratorAgent:
             "description": plan.description,
             "abstraction_level": plan.abstraction_level,
             "source_text": {
-                "methodology": paper.sections.get("methodology").text if paper.sections.get("methodology") else "",
-                "system": paper.sections.get("system").text if paper.sections.get("system") else "",
-                "results": paper.sections.get("results").text if paper.sections.get("results") else "",
+                name: section.text if (section := paper.sections.get(name)) else ""
+                for name in ("methodology", "system", "results")
             },
             "source_spans": plan.source_spans,
             "style_refs": style_refs or {},
@@ -45,8 +44,7 @@ class GeneratorAgent:
         }
 
         spec_path = output_dir / "spec.json"
-        with open(spec_path, "w", encoding="utf-8") as handle:
-            json.dump(spec, handle, indent=2)
+        spec_path.write_bytes(dumps_indented(spec))
 
         svg, elements = self.paperbanana.generate_svg(spec)
         svg_path.write_text(svg, encoding="utf-8")
@@ -60,9 +58,7 @@ class GeneratorAgent:
                     "source_spans": plan.source_spans,
                 }
             ]
-
-        with open(element_metadata_path, "w", encoding="utf-8") as handle:
-            json.dump(elements, handle, indent=2)
+        element_metadata_path.write_bytes(dumps_indented(elements))
 
         traceability = build_traceability(plan.figure_id, elements)
         write_traceability(str(traceability_path), traceability)
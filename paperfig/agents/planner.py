@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import uuid
+import random
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from paperfig.templates.compiler import select_templates
 from paperfig.templates.loader import load_template_catalog
 from paperfig.utils.prompts import load_prompt
-from paperfig.utils.types import FigurePlan, PaperContent
+from paperfig.utils.types import FigurePlan, FlowTemplateCatalog, PaperContent
 
 
 class PlannerAgent:
@@ -15,9 +15,12 @@ class PlannerAgent:
         self.prompt = load_prompt("plan_figure.txt")
         self.template_dir = template_dir or Path("paperfig/templates/flows")
         self.template_pack = template_pack
+        self._catalog_cache: Dict[Tuple[Path, str], FlowTemplateCatalog] = {}
 
     def plan(self, paper: PaperContent) -> List[FigurePlan]:
-        template_plans = self._plan_from_templates(paper)
+        # One seeded draw per plan; figure ids are unique within a plan via the order suffix.
+        id_prefix = f"{random.Random().getrandbits(32):08x}"
+        template_plans = self._plan_from_templates(paper, id_prefix)
         if template_plans:
             return template_plans
 
@@ -40,7 +43,7 @@ class PlannerAgent:
                 )
             plans.append(
                 FigurePlan(
-                    figure_id=f"fig-{uuid.uuid4().hex[:8]}",
+                    figure_id=f"fig-{id_prefix}{order:04x}",
                     title=title,
                     kind=kind,
                     order=order,
@@ -53,7 +56,7 @@ class PlannerAgent:
             )
             order += 1
 
-        if paper.sections.get("methodology") and paper.sections["methodology"].text:
+        if (section := paper.sections.get("methodology")) and section.text:
             _add(
                 kind="methodology",
                 title="Methodology Diagram",
@@ -62,7 +65,7 @@ class PlannerAgent:
                 section_name="methodology",
             )
 
-        if paper.sections.get("system") and paper.sections["system"].text:
+        if (section := paper.sections.get("system")) and section.text:
             _add(
                 kind="system_overview",
                 title="System Overview",
@@ -71,7 +74,7 @@ class PlannerAgent:
                 section_name="system",
             )
 
-        if paper.sections.get("results") and paper.sections["results"].text:
+        if (section := paper.sections.get("results")) and section.text:
             _add(
                 kind="results_plot",
                 title="Results Summary",
@@ -91,13 +94,9 @@ class PlannerAgent:
 
         return plans
 
-    def _plan_from_templates(self, paper: PaperContent) -> List[FigurePlan]:
+    def _plan_from_templates(self, paper: PaperContent, id_prefix: str) -> List[FigurePlan]:
         try:
-            catalog = load_template_catalog(
-                template_dir=self.template_dir,
-                pack_id=self.template_pack,
-                pack=self.template_pack,
-            )
+            catalog = self._load_catalog()
         except Exception:
             return []
 
@@ -120,7 +119,7 @@ class PlannerAgent:
 
             plans.append(
                 FigurePlan(
-                    figure_id=f"fig-{uuid.uuid4().hex[:8]}",
+                    figure_id=f"fig-{id_prefix}{idx:04x}",
                     title=template.title,
                     kind=template.kind,
                     order=idx,
@@ -136,3 +135,15 @@ class PlannerAgent:
             )
 
         return plans
+
+    def _load_catalog(self) -> FlowTemplateCatalog:
+        key = (self.template_dir, self.template_pack)
+        catalog = self._catalog_cache.get(key)
+        if catalog is None:
+            catalog = load_template_catalog(
+                template_dir=self.template_dir,
+                pack_id=self.template_pack,
+                pack=self.template_pack,
+            )
+            self._catalog_cache[key] = catalog
+        return catalog
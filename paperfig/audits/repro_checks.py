@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import AbstractSet, Callable, Dict, Optional, Set
 
+from paperfig.utils.jsoncache import load_json_cached
 from paperfig.utils.types import ReproAuditCheck
 
 
@@ -14,12 +15,38 @@ class ReproCheckDefinition:
     description: str
     required: bool
     severity: str
-    evaluator: Callable[[Path, Optional[str]], ReproAuditCheck]
-
-
-def _artifact_check(run_dir: Path, relative_path: str, required: bool = True) -> ReproAuditCheck:
+    evaluator: Callable[..., ReproAuditCheck]
+
+
+def scan_run_artifacts(run_dir: Path) -> Set[str]:
+    """
+    List run artifacts with one scandir per directory. Names are relative to
+    run_dir; entries of the prompts/ subdirectory are prefixed with "prompts/".
+    """
+    present: Set[str] = set()
+    try:
+        with os.scandir(run_dir) as entries:
+            present.update(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return present
+
+    if "prompts" in present:
+        try:
+            with os.scandir(run_dir / "prompts") as entries:
+                present.update(f"prompts/{entry.name}" for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return present
+
+
+def _artifact_check(
+    run_dir: Path,
+    relative_path: str,
+    required: bool = True,
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
     path = run_dir / relative_path
-    exists = path.exists()
+    exists = relative_path in present if present is not None else path.exists()
     return ReproAuditCheck(
         check_id=f"artifact_{relative_path.replace('/', '_')}",
         description=f"Artifact exists: {relative_path}",
@@ -31,16 +58,24 @@ def _artifact_check(run_dir: Path, relative_path: str, required: bool = True) ->
     )
 
 
-def _load_run_json(run_dir: Path) -> tuple[Dict[str, object], bool]:
+def _load_run_json(
+    run_dir: Path,
+    present: Optional[AbstractSet[str]] = None,
+) -> tuple[Dict[str, object], bool]:
     run_json_path = run_dir / "run.json"
-    if not run_json_path.exists():
+    exists = "run.json" in present if present is not None else run_json_path.exists()
+    if not exists:
         return {}, False
-    return json.loads(run_json_path.read_text(encoding="utf-8")), True
+    return load_json_cached(run_json_path), True
 
 
-def _check_run_json_present(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
+def _check_run_json_present(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
     run_json_path = run_dir / "run.json"
-    exists = run_json_path.exists()
+    exists = "run.json" in present if present is not None else run_json_path.exists()
     return ReproAuditCheck(
         check_id="run_json_present",
         description="Run metadata file exists",
@@ -52,40 +87,76 @@ def _check_run_json_present(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
     )
 
 
-def _check_plan(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "plan.json", required=True)
+def _check_plan(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "plan.json", required=True, present=present)
 
 
-def _check_sections(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "sections.json", required=True)
+def _check_sections(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "sections.json", required=True, present=present)
 
 
-def _check_traceability(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "traceability.json", required=True)
+def _check_traceability(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "traceability.json", required=True, present=present)
 
 
-def _check_inspect(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "inspect.json", required=True)
+def _check_inspect(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "inspect.json", required=True, present=present)
 
 
-def _check_docs_drift(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "docs_drift_report.json", required=True)
+def _check_docs_drift(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "docs_drift_report.json", required=True, present=present)
 
 
-def _check_architecture_critique(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "architecture_critique.json", required=True)
+def _check_architecture_critique(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "architecture_critique.json", required=True, present=present)
 
 
-def _check_prompt_plan(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "prompts/plan_figure.txt", required=True)
+def _check_prompt_plan(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "prompts/plan_figure.txt", required=True, present=present)
 
 
-def _check_prompt_critique(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    return _artifact_check(run_dir, "prompts/critique_figure.txt", required=True)
+def _check_prompt_critique(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    return _artifact_check(run_dir, "prompts/critique_figure.txt", required=True, present=present)
 
 
-def _check_provenance(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    run_json, has_run_json = _load_run_json(run_dir)
+def _check_provenance(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    run_json, has_run_json = _load_run_json(run_dir, present)
     has_command_meta = bool(run_json.get("paper_path")) and bool(run_json.get("created_at"))
     return ReproAuditCheck(
         check_id="provenance_metadata",
@@ -98,8 +169,12 @@ def _check_provenance(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
     )
 
 
-def _check_seed_declared(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
-    run_json, _ = _load_run_json(run_dir)
+def _check_seed_declared(
+    run_dir: Path,
+    _: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    run_json, _ = _load_run_json(run_dir, present)
     has_seed = "seed" in run_json
     return ReproAuditCheck(
         check_id="deterministic_seed_declared",
@@ -112,8 +187,12 @@ def _check_seed_declared(run_dir: Path, _: Optional[str]) -> ReproAuditCheck:
     )
 
 
-def _check_config_hash(run_dir: Path, expected_config_hash: Optional[str]) -> ReproAuditCheck:
-    run_json, _ = _load_run_json(run_dir)
+def _check_config_hash(
+    run_dir: Path,
+    expected_config_hash: Optional[str],
+    present: Optional[AbstractSet[str]] = None,
+) -> ReproAuditCheck:
+    run_json, _ = _load_run_json(run_dir, present)
     if expected_config_hash is None:
         return ReproAuditCheck(
             check_id="config_hash_match",
@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import platform
 import sys
-import time
-from dataclasses import asdict
 from pathlib import Path
 from typing import Dict, List
 
-from paperfig.audits.repro_checks import get_repro_check_registry
-from paperfig.utils.types import ReproAuditReport
+from paperfig.audits.repro_checks import get_repro_check_registry, scan_run_artifacts
+from paperfig.utils.timestamps import utc_now_iso
+from paperfig.utils.types import ReproAuditCheck, ReproAuditReport
 
 
 def run_reproducibility_audit(
@@ -18,16 +17,20 @@ def run_reproducibility_audit(
 ) -> ReproAuditReport:
     run_id = run_dir.name
     checks = []
+    required_failed = 0
     registry = get_repro_check_registry()
-    for check in registry.values():
-        checks.append(check.evaluator(run_dir, expected_config_hash))
+    present = scan_run_artifacts(run_dir)
+    for definition in registry.values():
+        check = definition.evaluator(run_dir, expected_config_hash, present=present)
+        checks.append(check)
+        if check.required and not check.passed:
+            required_failed += 1
 
-    required_failed = [check for check in checks if check.required and not check.passed]
-    passed = len(required_failed) == 0
+    passed = required_failed == 0
 
     summary = "Reproducibility checks passed."
     if not passed:
-        summary = f"{len(required_failed)} required reproducibility check(s) failed."
+        summary = f"{required_failed} required reproducibility check(s) failed."
 
     return ReproAuditReport(
         run_id=run_id,
@@ -35,7 +38,7 @@ def run_reproducibility_audit(
         checks=checks,
         passed=passed,
         summary=summary,
-        generated_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        generated_at=utc_now_iso(),
         environment={
             "python_version": sys.version,
             "platform": platform.platform(),
@@ -43,5 +46,26 @@ def run_reproducibility_audit(
     )
 
 
+def _check_to_dict(check: ReproAuditCheck) -> Dict[str, object]:
+    return {
+        "check_id": check.check_id,
+        "description": check.description,
+        "required": check.required,
+        "passed": check.passed,
+        "severity": check.severity,
+        "message": check.message,
+        "details": dict(check.details),
+    }
+
+
 def report_to_dict(report: ReproAuditReport) -> Dict[str, object]:
-    return asdict(report)
+    # Equivalent to dataclasses.asdict without its recursive deepcopy of every field.
+    return {
+        "run_id": report.run_id,
+        "mode": report.mode,
+        "checks": [_check_to_dict(check) for check in report.checks],
+        "passed": report.passed,
+        "summary": report.summary,
+        "generated_at": report.generated_at,
+        "environment": dict(report.environment),
+    }
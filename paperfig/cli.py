@@ -1,41 +1,33 @@
 from __future__ import annotations
 
 import importlib
-import json
 import os
 import platform
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import shlex
 import shutil
-from typing import List, Optional
+import sys
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
 
-import typer
-
-try:
+# The console script imports this module before dispatching. Answer a bare
+# `paperfig --version` here, before typer/rich are loaded and the command tree is built.
+if Path(sys.argv[0]).stem == "paperfig" and sys.argv[1:] == ["--version"]:
     from paperfig import __version__
-except Exception:
-    try:
-        from importlib.metadata import version as _pkg_version
 
-        __version__ = _pkg_version("paperfigg")
-    except Exception:
-        __version__ = "0.4.0"
+    print(__version__)
+    raise SystemExit(0)
+
+import typer
 
 PACKAGE_NAME = "paperfigg"
-from paperfig.agents.architecture_critic import SEVERITY_ORDER
-from paperfig.agents.critic import CriticAgent
-from paperfig.command_catalog import get_command_catalog
-from paperfig.lab.orchestrator import LabOrchestrator
-from paperfig.pipeline.orchestrator import Orchestrator
-from paperfig.plugins.registry import list_plugins as list_registered_plugins
-from paperfig.plugins.registry import validate_plugins as validate_registered_plugins
-from paperfig.templates.lint import lint_template_catalog
-from paperfig.templates.loader import load_template_catalog, validate_template_catalog
-from paperfig.utils.config import load_config
-from paperfig.journals import load_journal_profile
-from paperfig.utils.paperbanana import PaperBananaClient
-from paperfig.utils.pdf_parser import parse_paper
-from paperfig.utils.types import FigurePlan, PaperContent, PaperSection
+
+# Subsystem imports live inside the commands that use them so `--version`, `--help`
+# and shell completion do not pay for loading the pipeline.
+if TYPE_CHECKING:
+    from paperfig.lab.orchestrator import LabOrchestrator
+    from paperfig.pipeline.orchestrator import Orchestrator
 
 app = typer.Typer(help="Generate publication-ready figures from research papers.")
 docs_app = typer.Typer(help="Documentation regeneration and drift checks.")
@@ -43,14 +35,33 @@ templates_app = typer.Typer(help="Flow template utilities.")
 lab_app = typer.Typer(help="Autonomous research lab workflows.")
 plugins_app = typer.Typer(help="Plugin registry utilities.")
 
-app.add_typer(docs_app, name="docs")
-app.add_typer(templates_app, name="templates")
-app.add_typer(lab_app, name="lab")
-app.add_typer(plugins_app, name="plugins")
+
+def _sniff_subcommand() -> Optional[str]:
+    """Top-level command named on the `paperfig` command line, or None when the full tree is needed."""
+    if Path(sys.argv[0]).stem != "paperfig" or len(sys.argv) < 2 or "_PAPERFIG_COMPLETE" in os.environ:
+        return None
+    candidate = sys.argv[1]
+    return None if candidate.startswith("-") else candidate
+
+
+# Typer builds a click group for every attached sub-app on each invocation. A direct
+# `paperfig <command>` run only attaches the group it names; help, completion and
+# in-process callers (tests, CliRunner) always see the whole tree.
+_requested_command = _sniff_subcommand()
+for _group_name, _group_app in (
+    ("docs", docs_app),
+    ("templates", templates_app),
+    ("lab", lab_app),
+    ("plugins", plugins_app),
+):
+    if _requested_command is None or _requested_command == _group_name:
+        app.add_typer(_group_app, name=_group_name)
 
 
 def _version_callback(value: bool) -> None:
     if value:
+        from paperfig import __version__
+
         typer.echo(__version__)
         raise typer.Exit()
 
@@ -68,66 +79,172 @@ def main(
     del version
 
 
+def _config_stamp() -> Tuple[str, Optional[int]]:
+    # Orchestrators read the relative paperfig.yaml; cached instances are reused only while
+    # the working directory and that file are unchanged.
+    try:
+        config_mtime_ns = Path("paperfig.yaml").stat().st_mtime_ns
+    except OSError:
+        config_mtime_ns = None
+    return os.getcwd(), config_mtime_ns
+
+
 def _lab_orchestrator() -> LabOrchestrator:
+    return _cached_lab_orchestrator(*_config_stamp())
+
+
+@lru_cache(maxsize=8)
+def _cached_lab_orchestrator(cwd: str, config_mtime_ns: Optional[int]) -> LabOrchestrator:
+    del cwd, config_mtime_ns
+    from paperfig.lab.orchestrator import LabOrchestrator
+    from paperfig.utils.config import load_config
+
     config = load_config()
     lab_cfg = config.get("lab", {})
     return LabOrchestrator(
-        root_dir=Path(str(lab_cfg.get("registry_dir", "lab_runs"))),
-        policy_path=Path(str(lab_cfg.get("sandbox_policy", "config/lab_policy.yaml"))),
+        root_dir=Path(lab_cfg.get("registry_dir", "lab_runs")),
+        policy_path=Path(lab_cfg.get("sandbox_policy", "config/lab_policy.yaml")),
         runs_root=Path("runs"),
     )
 
 
-def _dependency_check(module_name: str, required: bool) -> dict:
+def _orchestrator(run_root: Path = Path("runs")) -> Orchestrator:
+    """Shared Orchestrator for read-side commands; callers must not mutate it."""
+    return _cached_orchestrator(run_root, *_config_stamp())
+
+
+@lru_cache(maxsize=8)
+def _cached_orchestrator(run_root: Path, cwd: str, config_mtime_ns: Optional[int]) -> Orchestrator:
+    del cwd, config_mtime_ns
+    from paperfig.pipeline.orchestrator import Orchestrator
+
+    return Orchestrator(run_root=run_root)
+
+
+def _dumps_json(data: object) -> str:
+    from paperfig.utils.fastjson import dumps_indented
+
+    return dumps_indented(data).decode("utf-8")
+
+
+def _echo_json(data: object) -> None:
+    # click writes bytes straight to the binary stdout buffer, skipping a decode/encode round-trip.
+    from paperfig.utils.fastjson import dumps_indented
+
+    typer.echo(dumps_indented(data))
+
+
+_PAPERBANANA_MODES = frozenset({"auto", "mock", "real"})
+_ARCH_CRITIQUE_MODES = frozenset({"inline", "off"})
+_AUDIT_MODES = frozenset({"soft", "hard"})
+_FIX_SUBSYSTEMS = frozenset({"png"})
+_MOCK_ENV_BY_MODE = {"mock": "1", "real": "0"}
+
+
+def _choice_callback(allowed: frozenset, message: str) -> Callable[[Optional[str]], Optional[str]]:
+    """Build a typer option callback that rejects values outside `allowed` during parsing."""
+
+    def _validate(value: Optional[str]) -> Optional[str]:
+        if value is not None and value not in allowed:
+            raise typer.BadParameter(message)
+        return value
+
+    return _validate
+
+
+@contextmanager
+def _paperbanana_mode(mode: str) -> Iterator[None]:
+    """Force PAPERFIG_MOCK_PAPERBANANA for mock/real modes, restoring it afterwards."""
+    value = _MOCK_ENV_BY_MODE.get(mode)
+    if value is None:
+        yield
+        return
+    previous = os.environ.get("PAPERFIG_MOCK_PAPERBANANA")
+    os.environ["PAPERFIG_MOCK_PAPERBANANA"] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("PAPERFIG_MOCK_PAPERBANANA", None)
+        else:
+            os.environ["PAPERFIG_MOCK_PAPERBANANA"] = previous
+
+
+@lru_cache(maxsize=None)
+def _import_error(module_name: str) -> Optional[str]:
     try:
         importlib.import_module(module_name)
+    except Exception as exc:
+        return str(exc)
+    return None
+
+
+def _dependency_check(module_name: str, required: bool) -> dict:
+    error = _import_error(module_name)
+    if error is None:
         return {
             "check": f"python_module:{module_name}",
             "status": "ok",
             "required": required,
             "message": f"Module '{module_name}' is importable.",
         }
-    except Exception as exc:
-        status = "fail" if required else "warn"
-        message = f"Module '{module_name}' is unavailable: {exc}"
-        if module_name == "cairosvg":
-            message = f"{message} Run: paperfig doctor --fix png"
-        return {
-            "check": f"python_module:{module_name}",
-            "status": status,
-            "required": required,
-            "message": message,
-        }
+    status = "fail" if required else "warn"
+    message = f"Module '{module_name}' is unavailable: {error}"
+    if module_name == "cairosvg":
+        message = f"{message} Run: paperfig doctor --fix png"
+    return {
+        "check": f"python_module:{module_name}",
+        "status": status,
+        "required": required,
+        "message": message,
+    }
+
+
+_WINDOWS_PNG_FIX_GUIDANCE = "\n".join(
+    [
+        "Windows PNG setup options:",
+        "1) MSYS2 UCRT64 (recommended for system-wide Cairo):",
+        "   - winget install MSYS2.MSYS2",
+        "   - C:\\msys64\\ucrt64.exe",
+        "   - pacman -Syu",
+        "   - pacman -S --needed mingw-w64-ucrt-x86_64-cairo mingw-w64-ucrt-x86_64-pango mingw-w64-ucrt-x86_64-gdk-pixbuf2",
+        "   - Add C:\\msys64\\ucrt64\\bin to PATH",
+        "2) Conda-forge environment:",
+        "   - conda create -n paperfig-png python=3.10 cairosvg cairo pango gdk-pixbuf -c conda-forge",
+        "   - conda activate paperfig-png",
+        "Verification:",
+        "   - paperfig doctor --fix png --verify",
+        "   - paperfig doctor",
+    ]
+)
+_DEFAULT_PNG_FIX_GUIDANCE = "\n".join(
+    [
+        "Install Cairo system libraries and cairosvg for PNG export.",
+        "Then verify with:",
+        "  - paperfig doctor --fix png --verify",
+        "  - paperfig doctor",
+    ]
+)
 
 
+@lru_cache(maxsize=None)
 def _png_fix_guidance() -> str:
-    system = platform.system().lower()
-    if system.startswith("windows"):
-        return "\n".join(
-            [
-                "Windows PNG setup options:",
-                "1) MSYS2 UCRT64 (recommended for system-wide Cairo):",
-                "   - winget install MSYS2.MSYS2",
-                "   - C:\\msys64\\ucrt64.exe",
-                "   - pacman -Syu",
-                "   - pacman -S --needed mingw-w64-ucrt-x86_64-cairo mingw-w64-ucrt-x86_64-pango mingw-w64-ucrt-x86_64-gdk-pixbuf2",
-                "   - Add C:\\msys64\\ucrt64\\bin to PATH",
-                "2) Conda-forge environment:",
-                "   - conda create -n paperfig-png python=3.10 cairosvg cairo pango gdk-pixbuf -c conda-forge",
-                "   - conda activate paperfig-png",
-                "Verification:",
-                "   - paperfig doctor --fix png --verify",
-                "   - paperfig doctor",
-            ]
-        )
-    return "\n".join(
-        [
-            "Install Cairo system libraries and cairosvg for PNG export.",
-            "Then verify with:",
-            "  - paperfig doctor --fix png --verify",
-            "  - paperfig doctor",
-        ]
-    )
+    # Resolved on first use so the platform probe stays off the import path.
+    if platform.system().lower().startswith("windows"):
+        return _WINDOWS_PNG_FIX_GUIDANCE
+    return _DEFAULT_PNG_FIX_GUIDANCE
+
+
+@lru_cache(maxsize=16)
+def _mcp_command_error(command: str, path: Optional[str]) -> Optional[str]:
+    # Keyed on PATH as well, so a changed search path re-resolves the binary.
+    command_parts = shlex.split(command)
+    command_bin = command_parts[0] if command_parts else ""
+    if not command_bin:
+        return "PAPERFIG_MCP_COMMAND is set but empty after parsing."
+    if shutil.which(command_bin, path=path) is None:
+        return f"MCP command binary '{command_bin}' is not on PATH."
+    return None
 
 
 def _mcp_check(probe_mcp: bool) -> dict:
@@ -160,21 +277,13 @@ def _mcp_check(probe_mcp: bool) -> dict:
         }
 
     if command:
-        command_parts = shlex.split(command)
-        command_bin = command_parts[0] if command_parts else ""
-        if not command_bin:
-            return {
-                "check": "paperbanana_mcp",
-                "status": "fail",
-                "required": False,
-                "message": "PAPERFIG_MCP_COMMAND is set but empty after parsing.",
-            }
-        if shutil.which(command_bin) is None:
+        command_error = _mcp_command_error(command, os.environ.get("PATH"))
+        if command_error:
             return {
                 "check": "paperbanana_mcp",
                 "status": "fail",
                 "required": False,
-                "message": f"MCP command binary '{command_bin}' is not on PATH.",
+                "message": command_error,
             }
 
     if not probe_mcp:
@@ -186,6 +295,8 @@ def _mcp_check(probe_mcp: bool) -> dict:
         }
 
     try:
+        from paperfig.utils.paperbanana import PaperBananaClient
+
         client = PaperBananaClient()
         client.generate_svg(
             {
@@ -219,8 +330,9 @@ def _mcp_check(probe_mcp: bool) -> dict:
 def _render_doctor_output(report: dict) -> None:
     checks = report.get("checks", [])
     try:
-        from rich.console import Console
+        from rich.console import Console, Group
         from rich.table import Table
+        from rich.text import Text
 
         table = Table(title="paperfig doctor")
         table.add_column("Check", justify="left")
@@ -228,42 +340,47 @@ def _render_doctor_output(report: dict) -> None:
         table.add_column("Required", justify="center")
         table.add_column("Message", justify="left")
 
-        status_style = {"ok": "green", "warn": "yellow", "fail": "red"}
+        status_text = {
+            "ok": Text("ok", style="green"),
+            "warn": Text("warn", style="yellow"),
+            "fail": Text("fail", style="red"),
+        }
         for check in checks:
             status = str(check.get("status", "warn"))
             table.add_row(
                 str(check.get("check", "")),
-                f"[{status_style.get(status, 'white')}]{status}[/{status_style.get(status, 'white')}]",
+                status_text.get(status) or Text(status, style="white"),
                 "yes" if check.get("required", False) else "no",
                 str(check.get("message", "")),
             )
 
-        console = Console()
-        console.print(table)
-        console.print(f"Package: {PACKAGE_NAME} | Command: paperfig")
-        console.print(
+        renderables = [
+            table,
+            f"Package: {PACKAGE_NAME} | Command: paperfig",
             f"Overall: {'PASS' if report.get('passed') else 'FAIL'} "
             f"(required failures: {report.get('required_failures', 0)}, "
-            f"optional failures: {report.get('optional_failures', 0)})"
-        )
+            f"optional failures: {report.get('optional_failures', 0)})",
+        ]
         if any("paperfig doctor --fix png" in str(check.get("message", "")) for check in checks):
-            console.print("Hint: paperfig doctor --fix png")
+            renderables.append("Hint: paperfig doctor --fix png")
+        Console().print(Group(*renderables))
     except Exception:
-        typer.echo("paperfig doctor")
+        lines = ["paperfig doctor"]
         for check in checks:
-            typer.echo(
+            lines.append(
                 f"- {check.get('check')}: {check.get('status')} "
                 f"(required={check.get('required')}) {check.get('message')}"
             )
-        typer.echo(f"Package: {PACKAGE_NAME} | Command: paperfig")
-        typer.echo(
+        lines.append(f"Package: {PACKAGE_NAME} | Command: paperfig")
+        lines.append(
             "Overall: "
             f"{'PASS' if report.get('passed') else 'FAIL'} "
             f"(required failures: {report.get('required_failures', 0)}, "
             f"optional failures: {report.get('optional_failures', 0)})"
         )
         if any("paperfig doctor --fix png" in str(check.get("message", "")) for check in checks):
-            typer.echo("Hint: paperfig doctor --fix png")
+            lines.append("Hint: paperfig doctor --fix png")
+        typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -288,6 +405,7 @@ def generate(
     arch_critique_mode: str = typer.Option(
         "inline",
         help="Architecture critique mode: inline or off.",
+        callback=_choice_callback(_ARCH_CRITIQUE_MODES, "arch_critique_mode must be one of: inline, off"),
     ),
     arch_critique_block_severity: str = typer.Option(
         "critical",
@@ -308,6 +426,8 @@ def generate(
         profile_id = mode.split(":", 1)[1].strip()
         if not profile_id:
             raise typer.BadParameter("journal mode requires a profile name, e.g. journal:neurips")
+        from paperfig.journals import load_journal_profile
+
         journal_profile = load_journal_profile(profile_id)
         max_iterations = journal_profile.max_iterations
         quality_threshold = journal_profile.quality_threshold
@@ -316,48 +436,39 @@ def generate(
         arch_critique_block_severity = journal_profile.arch_critique_block_severity
         repro_audit_mode = journal_profile.repro_audit_mode
         mode = "auto"
-    elif mode not in {"auto", "mock", "real"}:
+    elif mode not in _PAPERBANANA_MODES:
         raise typer.BadParameter("mode must be one of: auto, mock, real, journal:<profile>")
-    if arch_critique_mode not in {"inline", "off"}:
-        raise typer.BadParameter("arch_critique_mode must be one of: inline, off")
+
+    from paperfig.agents.architecture_critic import SEVERITY_NAMES, SEVERITY_ORDER
+
     if arch_critique_block_severity not in SEVERITY_ORDER:
         raise typer.BadParameter(
-            f"arch_critique_block_severity must be one of: {', '.join(SEVERITY_ORDER.keys())}"
+            f"arch_critique_block_severity must be one of: {SEVERITY_NAMES}"
         )
-    if repro_audit_mode not in {"soft", "hard"}:
+    if repro_audit_mode not in _AUDIT_MODES:
         raise typer.BadParameter("repro_audit_mode must be one of: soft, hard")
 
-    previous_mock_mode = os.getenv("PAPERFIG_MOCK_PAPERBANANA")
-    if mode == "mock":
-        os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "1"
-    elif mode == "real":
-        os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "0"
+    from paperfig.pipeline.orchestrator import Orchestrator
 
     try:
-        orchestrator = Orchestrator(
-            run_root=run_root,
-            max_iterations=max_iterations,
-            quality_threshold=quality_threshold,
-            dimension_threshold=dimension_threshold,
-            template_pack=template_pack,
-            arch_critique_mode=arch_critique_mode,
-            arch_critique_block_severity=arch_critique_block_severity,
-            repro_audit_mode=repro_audit_mode,
-            journal_profile=journal_profile,
-        )
-        run_id = orchestrator.generate(paper_path, contrib=contrib)
+        with _paperbanana_mode(mode):
+            orchestrator = Orchestrator(
+                run_root=run_root,
+                max_iterations=max_iterations,
+                quality_threshold=quality_threshold,
+                dimension_threshold=dimension_threshold,
+                template_pack=template_pack,
+                arch_critique_mode=arch_critique_mode,
+                arch_critique_block_severity=arch_critique_block_severity,
+                repro_audit_mode=repro_audit_mode,
+                journal_profile=journal_profile,
+            )
+            run_id = orchestrator.generate(paper_path, contrib=contrib)
     except RuntimeError as exc:
         typer.echo(f"Generation failed: {exc}")
         raise typer.Exit(code=1)
-    finally:
-        if mode in {"mock", "real"}:
-            if previous_mock_mode is None:
-                os.environ.pop("PAPERFIG_MOCK_PAPERBANANA", None)
-            else:
-                os.environ["PAPERFIG_MOCK_PAPERBANANA"] = previous_mock_mode
 
-    typer.echo(f"Run created: {run_id}")
-    typer.echo(f"Output directory: {run_root / run_id}")
+    typer.echo(f"Run created: {run_id}\nOutput directory: {run_root / run_id}")
 
 
 @app.command()
@@ -370,6 +481,10 @@ def critique(
         help="Minimum score required for each critique dimension.",
     ),
 ) -> None:
+    from paperfig.agents.critic import CriticAgent
+    from paperfig.utils.pdf_parser import parse_paper
+    from paperfig.utils.types import FigurePlan, PaperContent, PaperSection
+
     if paper_path:
         paper = parse_paper(paper_path)
     else:
@@ -397,7 +512,7 @@ def critique(
 
     critic = CriticAgent(threshold=threshold, dimension_threshold=dimension_threshold)
     report = critic.critique(figure_path, plan, paper)
-    typer.echo(json.dumps(report.__dict__, indent=2))
+    _echo_json(report)
 
 
 @app.command()
@@ -410,14 +525,13 @@ def rerun(
         help="Contributor mode for the replayed run.",
     ),
 ) -> None:
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     try:
         new_run_id = orchestrator.rerun(source_run_id=run_id, contrib=contrib)
     except RuntimeError as exc:
         typer.echo(f"Rerun failed: {exc}")
         raise typer.Exit(code=1)
-    typer.echo(f"Rerun created: {new_run_id}")
-    typer.echo(f"Output directory: {run_root / new_run_id}")
+    typer.echo(f"Rerun created: {new_run_id}\nOutput directory: {run_root / new_run_id}")
 
 
 @app.command()
@@ -428,65 +542,45 @@ def diff(
     output_dir: Optional[Path] = typer.Option(None, help="Optional output directory for diff artifacts"),
     as_json: bool = typer.Option(False, "--as-json", help="Print diff report as JSON"),
 ) -> None:
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     report = orchestrator.diff(run_id_1=run_id_1, run_id_2=run_id_2, output_dir=output_dir)
     if as_json:
-        typer.echo(json.dumps(report, indent=2))
+        _echo_json(report)
         return
 
-    typer.echo(f"Run 1: {run_id_1}")
-    typer.echo(f"Run 2: {run_id_2}")
-    typer.echo(f"Diff output: {Path(report.get('diff_dir', '')) / 'diff.json'}")
     metrics = report.get("metrics", {})
-    typer.echo(
-        "accepted_count: "
-        f"{metrics.get('accepted_count', {}).get('run_1')} -> "
-        f"{metrics.get('accepted_count', {}).get('run_2')}"
-    )
-    typer.echo(
-        "avg_final_score: "
-        f"{metrics.get('avg_final_score', {}).get('run_1')} -> "
-        f"{metrics.get('avg_final_score', {}).get('run_2')}"
-    )
-    typer.echo(
-        "avg_traceability_coverage: "
-        f"{metrics.get('avg_traceability_coverage', {}).get('run_1')} -> "
-        f"{metrics.get('avg_traceability_coverage', {}).get('run_2')}"
-    )
-    typer.echo(f"Changed figures: {len(report.get('changed_figures', []))}")
-    typer.echo(f"Changed JSON artifacts: {len(report.get('changed_artifacts', []))}")
+    diff_json = Path(report.get("diff_dir", "")) / "diff.json"
+    lines = [f"Run 1: {run_id_1}", f"Run 2: {run_id_2}", f"Diff output: {diff_json}"]
+    for metric in ("accepted_count", "avg_final_score", "avg_traceability_coverage"):
+        values = metrics.get(metric, {})
+        lines.append(f"{metric}: {values.get('run_1')} -> {values.get('run_2')}")
+    lines.append(f"Changed figures: {len(report.get('changed_figures', []))}")
+    lines.append(f"Changed JSON artifacts: {len(report.get('changed_artifacts', []))}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
 def regress(
     paper_v1: Path = typer.Argument(..., exists=True, help="Baseline paper (v1) path"),
     paper_v2: Path = typer.Argument(..., exists=True, help="Comparison paper (v2) path"),
-    mode: str = typer.Option("mock", "--mode", help="PaperBanana execution mode: auto, mock, or real."),
+    mode: str = typer.Option(
+        "mock",
+        "--mode",
+        help="PaperBanana execution mode: auto, mock, or real.",
+        callback=_choice_callback(_PAPERBANANA_MODES, "mode must be one of: auto, mock, real"),
+    ),
     run_root: Path = typer.Option(Path("runs"), help="Root directory for run outputs"),
     output_dir: Optional[Path] = typer.Option(None, help="Optional output directory for regression report"),
     as_json: bool = typer.Option(False, "--as-json", help="Print regression report as JSON"),
 ) -> None:
-    if mode not in {"auto", "mock", "real"}:
-        raise typer.BadParameter("mode must be one of: auto, mock, real")
+    from paperfig.pipeline.orchestrator import Orchestrator
 
-    previous_mock_mode = os.getenv("PAPERFIG_MOCK_PAPERBANANA")
-    if mode == "mock":
-        os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "1"
-    elif mode == "real":
-        os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "0"
-
-    try:
+    with _paperbanana_mode(mode):
         orchestrator = Orchestrator(run_root=run_root)
         report = orchestrator.regress(paper_v1, paper_v2, output_dir=output_dir)
-    finally:
-        if mode in {"mock", "real"}:
-            if previous_mock_mode is None:
-                os.environ.pop("PAPERFIG_MOCK_PAPERBANANA", None)
-            else:
-                os.environ["PAPERFIG_MOCK_PAPERBANANA"] = previous_mock_mode
 
     if as_json:
-        typer.echo(json.dumps(report, indent=2))
+        _echo_json(report)
         return
 
     typer.echo(f"Regression report: {Path(report.get('report_dir', '')) / 'regression_report.json'}")
@@ -499,14 +593,24 @@ def export(
     run_root: Path = typer.Option(Path("runs"), help="Root directory for run outputs"),
     output_dir: Optional[Path] = typer.Option(None, help="Optional export output directory"),
 ) -> None:
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     export_root = orchestrator.export(run_id, output_dir=output_dir)
-    typer.echo(f"Exports written to: {export_root}")
-    report_path = export_root / "export_report.json"
-    if report_path.exists():
-        report = json.loads(report_path.read_text(encoding="utf-8"))
-        for warning in report.get("warnings", []):
-            typer.echo(f"Warning: {warning}")
+    lines = [f"Exports written to: {export_root}"]
+    lines.extend(f"Warning: {warning}" for warning in _export_warnings(export_root))
+    typer.echo("\n".join(lines))
+
+
+def _export_warnings(export_root: Path) -> List[str]:
+    try:
+        data = (export_root / "export_report.json").read_bytes()
+    except FileNotFoundError:
+        return []
+    # Only a report without a warnings key can be skipped unparsed; anything else is parsed.
+    if b'"warnings"' not in data:
+        return []
+    from paperfig.utils.fastjson import loads
+
+    return loads(data).get("warnings") or []
 
 
 @app.command()
@@ -526,6 +630,7 @@ def doctor(
         None,
         "--fix",
         help="Show guided fix instructions for a subsystem (currently: png).",
+        callback=_choice_callback(_FIX_SUBSYSTEMS, "fix must be one of: png"),
     ),
     verify: bool = typer.Option(
         False,
@@ -533,8 +638,7 @@ def doctor(
         help="Re-run targeted verification for the selected --fix subsystem.",
     ),
 ) -> None:
-    if fix and fix not in {"png"}:
-        raise typer.BadParameter("fix must be one of: png")
+    from paperfig import __version__
 
     checks = [
         _dependency_check("typer", required=True),
@@ -560,7 +664,7 @@ def doctor(
     }
 
     if as_json:
-        typer.echo(json.dumps(report, indent=2))
+        _echo_json(report)
     else:
         _render_doctor_output(report)
         if fix == "png":
@@ -596,15 +700,17 @@ def critique_architecture(
         help="Enable a subset of architecture rules (repeatable). Default: all built-in rules.",
     ),
 ) -> None:
+    from paperfig.agents.architecture_critic import SEVERITY_NAMES, SEVERITY_ORDER
+
     if block_severity not in SEVERITY_ORDER:
         raise typer.BadParameter(
-            f"block_severity must be one of: {', '.join(SEVERITY_ORDER.keys())}"
+            f"block_severity must be one of: {SEVERITY_NAMES}"
         )
 
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     if list_rules:
-        for rule in orchestrator.architecture_critic.available_rules():
-            typer.echo(f"- {rule['rule_id']}: {rule['description']}")
+        rules = orchestrator.architecture_critic.available_rules()
+        typer.echo("\n".join(f"- {rule['rule_id']}: {rule['description']}" for rule in rules))
         return
     if not run_id:
         raise typer.BadParameter("run_id is required unless --list-rules is provided")
@@ -620,37 +726,42 @@ def critique_architecture(
         raise typer.BadParameter(str(exc)) from exc
 
     if as_json:
-        typer.echo(json.dumps(report, indent=2))
+        _echo_json(report)
         return
 
-    typer.echo(f"Run: {run_id}")
-    typer.echo(f"Summary: {report.get('summary')}")
-    typer.echo(f"Blocked: {report.get('blocked')}")
-    findings = report.get("findings", [])
-    for finding in findings:
-        typer.echo(f"- [{finding.get('severity')}] {finding.get('title')}: {finding.get('description')}")
+    lines = [
+        f"Run: {run_id}",
+        f"Summary: {report.get('summary')}",
+        f"Blocked: {report.get('blocked')}",
+    ]
+    for finding in report.get("findings", []):
+        lines.append(f"- [{finding.get('severity')}] {finding.get('title')}: {finding.get('description')}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
 def audit(
     run_id: str = typer.Argument(..., help="Run ID to audit"),
     run_root: Path = typer.Option(Path("runs"), help="Root directory for run outputs"),
-    mode: str = typer.Option("soft", help="Audit mode: soft or hard"),
+    mode: str = typer.Option(
+        "soft",
+        help="Audit mode: soft or hard",
+        callback=_choice_callback(_AUDIT_MODES, "mode must be one of: soft, hard"),
+    ),
     as_json: bool = typer.Option(False, "--as-json", help="Print report as JSON"),
 ) -> None:
-    if mode not in {"soft", "hard"}:
-        raise typer.BadParameter("mode must be one of: soft, hard")
-
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     report = orchestrator.audit(run_id=run_id, mode=mode, persist=True)
 
     if as_json:
-        typer.echo(json.dumps(report, indent=2))
+        _echo_json(report)
     else:
-        typer.echo(f"Run: {run_id}")
-        typer.echo(f"Mode: {mode}")
-        typer.echo(f"Passed: {report.get('passed')}")
-        typer.echo(f"Summary: {report.get('summary')}")
+        typer.echo(
+            f"Run: {run_id}\n"
+            f"Mode: {mode}\n"
+            f"Passed: {report.get('passed')}\n"
+            f"Summary: {report.get('summary')}"
+        )
 
     if mode == "hard" and not report.get("passed", False):
         raise typer.Exit(code=1)
@@ -684,7 +795,7 @@ def inspect(
     ),
     output_path: Optional[Path] = typer.Option(None, help="Optional path to write summary JSON"),
 ) -> None:
-    orchestrator = Orchestrator(run_root=run_root)
+    orchestrator = _orchestrator(run_root)
     summary = orchestrator.inspect(
         run_id,
         failures_only=failures_only,
@@ -694,8 +805,10 @@ def inspect(
     )
 
     if output_path:
+        from paperfig.utils.fastjson import write_indented
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        write_indented(output_path, summary)
         typer.echo(f"Summary written to: {output_path}")
 
     if html:
@@ -703,41 +816,39 @@ def inspect(
         typer.echo(f"HTML inspector written to: {html_path}")
 
     if as_json:
-        typer.echo(json.dumps(summary, indent=2))
+        _echo_json(summary)
         return
 
     aggregate = summary.get("aggregate", {})
     metadata = summary.get("metadata", {})
-    typer.echo(f"Run: {summary.get('run_id')}")
+    lines = [f"Run: {summary.get('run_id')}"]
     if metadata.get("paper_path"):
-        typer.echo(f"Paper: {metadata['paper_path']}")
-    typer.echo(
+        lines.append(f"Paper: {metadata['paper_path']}")
+    lines.append(
         "Figures: "
         f"{aggregate.get('accepted_count', 0)}/{aggregate.get('total_figures', 0)} accepted, "
         f"{aggregate.get('failed_count', 0)} failed"
     )
-    typer.echo(
+    lines.append(
         "Averages: "
         f"score={aggregate.get('avg_final_score')} "
         f"traceability_coverage={aggregate.get('avg_traceability_coverage')}"
     )
 
-    for figure in summary.get("figures", []):
-        coverage = figure.get("traceability", {}).get("coverage")
+    append = lines.append
+    for figure in summary.get("figures", ()):
+        coverage = (figure.get("traceability") or {}).get("coverage")
         coverage_text = f"{coverage:.2f}" if isinstance(coverage, (int, float)) else "n/a"
-        typer.echo(
-            f"- {figure.get('figure_id')} "
-            f"passed={figure.get('final_passed')} "
-            f"iter={figure.get('iterations_attempted')} "
-            f"score={figure.get('final_score')} "
+        append(
+            f"- {figure.get('figure_id')} passed={figure.get('final_passed')} "
+            f"iter={figure.get('iterations_attempted')} score={figure.get('final_score')} "
             f"coverage={coverage_text}"
         )
-        issues = figure.get("issues") or []
-        if issues:
-            typer.echo(f"  issue: {issues[0]}")
+        if issues := figure.get("issues"):
+            append(f"  issue: {issues[0]}")
 
-    for warning in summary.get("warnings", []):
-        typer.echo(f"Warning: {warning}")
+    lines.extend(f"Warning: {warning}" for warning in summary.get("warnings") or ())
+    typer.echo("\n".join(lines))
 
 
 @docs_app.command("regenerate")
@@ -745,7 +856,7 @@ def docs_regenerate(
     check: bool = typer.Option(False, "--check", help="Check for drift without applying changes."),
     report_path: Optional[Path] = typer.Option(None, help="Optional path to write drift report JSON."),
 ) -> None:
-    orchestrator = Orchestrator()
+    orchestrator = _orchestrator()
     report = orchestrator.docs_regenerate(check_only=check, report_path=report_path)
 
     typer.echo(f"Checked documents: {len(report.get('documents', []))}")
@@ -772,10 +883,12 @@ def templates_list(
         help="External template pack source (directory path or python package).",
     ),
 ) -> None:
+    from paperfig.templates.loader import load_template_catalog
+
     catalog = load_template_catalog(template_dir=template_dir, pack_id=pack_id, pack=pack)
-    typer.echo(f"Template pack: {catalog.pack_id}")
-    for template in catalog.templates:
-        typer.echo(f"- {template.template_id}: {template.title} ({template.kind})")
+    lines = [f"Template pack: {catalog.pack_id}"]
+    lines.extend(f"- {template.template_id}: {template.title} ({template.kind})" for template in catalog.templates)
+    typer.echo("\n".join(lines))
 
 
 @templates_app.command("validate")
@@ -788,10 +901,11 @@ def templates_validate(
         help="External template pack source (directory path or python package).",
     ),
 ) -> None:
+    from paperfig.templates.loader import validate_template_catalog
+
     errors = validate_template_catalog(template_dir=template_dir, pack_id=pack_id, pack=pack)
     if errors:
-        for error in errors:
-            typer.echo(f"Error: {error}")
+        typer.echo("\n".join(f"Error: {error}" for error in errors))
         raise typer.Exit(code=1)
     typer.echo("Template catalog is valid.")
 
@@ -805,10 +919,11 @@ def templates_lint(
         help="External template pack source (directory path or python package).",
     ),
 ) -> None:
+    from paperfig.templates.lint import lint_template_catalog
+
     errors = lint_template_catalog(template_dir=template_dir, pack=pack)
     if errors:
-        for error in errors:
-            typer.echo(f"Error: {error}")
+        typer.echo("\n".join(f"Error: {error}" for error in errors))
         raise typer.Exit(code=1)
     typer.echo("Flow templates satisfy flow_template.schema.json.")
 
@@ -820,12 +935,13 @@ def plugins_list(
         help="Optional plugin kind filter: critique_rule or repro_check.",
     ),
 ) -> None:
-    plugins = list_registered_plugins(kind=kind)
+    from paperfig.plugins.registry import list_plugins
+
+    plugins = list_plugins(kind=kind)
     if not plugins:
         typer.echo("No plugins found.")
         return
-    for plugin in plugins:
-        typer.echo(f"- {plugin.plugin_id} ({plugin.kind}): {plugin.description}")
+    typer.echo("\n".join(f"- {plugin.plugin_id} ({plugin.kind}): {plugin.description}" for plugin in plugins))
 
 
 @plugins_app.command("validate")
@@ -835,10 +951,11 @@ def plugins_validate(
         help="Optional plugin kind filter: critique_rule or repro_check.",
     ),
 ) -> None:
-    errors = validate_registered_plugins(kind=kind)
+    from paperfig.plugins.registry import validate_plugins
+
+    errors = validate_plugins(kind=kind)
     if errors:
-        for error in errors:
-            typer.echo(f"Error: {error}")
+        typer.echo("\n".join(f"Error: {error}" for error in errors))
         raise typer.Exit(code=1)
     typer.echo("Plugin registry is valid.")
 
@@ -884,16 +1001,17 @@ def lab_status(
 ) -> None:
     orchestrator = _lab_orchestrator()
     status = orchestrator.status(lab_run_id=run_id)
-    typer.echo(f"Lab run: {status.get('lab_run_id')}")
-    typer.echo(json.dumps(status.get("counts", {}), indent=2))
+    lines = [f"Lab run: {status.get('lab_run_id')}", _dumps_json(status.get("counts", {}))]
     for item in status.get("experiments", []):
-        typer.echo(f"- {item.get('experiment_id')} status={item.get('status')} topic={item.get('topic')}")
+        lines.append(f"- {item.get('experiment_id')} status={item.get('status')} topic={item.get('topic')}")
+    typer.echo("\n".join(lines))
 
 
 @app.command("command-catalog")
 def command_catalog() -> None:
-    for command in get_command_catalog():
-        typer.echo(command)
+    from paperfig.command_catalog import COMMAND_CATALOG
+
+    typer.echo("\n".join(COMMAND_CATALOG))
 
 
 if __name__ == "__main__":
@@ -1,31 +1,34 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Sequence, Tuple
 
 
-def get_command_catalog() -> List[str]:
-    return [
-        "generate",
-        "rerun",
-        "diff",
-        "regress",
-        "critique",
-        "export",
-        "doctor",
-        "inspect",
-        "inspect --html",
-        "docs regenerate",
-        "docs check",
-        "templates list",
-        "templates validate",
-        "templates lint",
-        "plugins list",
-        "plugins validate",
-        "critique-architecture",
-        "audit",
-        "lab init",
-        "lab propose",
-        "lab run",
-        "lab review",
-        "lab status",
-    ]
+COMMAND_CATALOG: Tuple[str, ...] = (
+    "generate",
+    "rerun",
+    "diff",
+    "regress",
+    "critique",
+    "export",
+    "doctor",
+    "inspect",
+    "inspect --html",
+    "docs regenerate",
+    "docs check",
+    "templates list",
+    "templates validate",
+    "templates lint",
+    "plugins list",
+    "plugins validate",
+    "critique-architecture",
+    "audit",
+    "lab init",
+    "lab propose",
+    "lab run",
+    "lab review",
+    "lab status",
+)
+
+
+def get_command_catalog() -> Sequence[str]:
+    return COMMAND_CATALOG
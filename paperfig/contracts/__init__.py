@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-import time
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from paperfig.utils.timestamps import utc_now_iso
 from paperfig.utils.types import FigureContract, FigurePlan, FlowTemplate
 
 
@@ -52,7 +52,7 @@ def build_figure_contract(
         source_spans=list(plan.source_spans),
         traceability_requirements=traceability_requirements,
         invariants=invariants,
-        created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        created_at=utc_now_iso(),
     )
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from . import (
     empty_plan,
@@ -15,7 +16,8 @@ from . import (
 from .base import ArchitectureRule
 
 
-def get_rule_registry() -> Dict[str, ArchitectureRule]:
+@lru_cache(maxsize=1)
+def _rule_registry() -> Dict[str, ArchitectureRule]:
     rules = [
         ArchitectureRule(
             rule_id=missing_inspect.RULE_ID,
@@ -61,23 +63,30 @@ def get_rule_registry() -> Dict[str, ArchitectureRule]:
     return {rule.rule_id: rule for rule in rules}
 
 
+@lru_cache(maxsize=1)
+def _sorted_rules() -> Tuple[ArchitectureRule, ...]:
+    registry = _rule_registry()
+    return tuple(registry[rule_id] for rule_id in sorted(registry))
+
+
+def get_rule_registry() -> Dict[str, ArchitectureRule]:
+    # The rules are frozen and built once; hand out a fresh mapping so callers may mutate it.
+    return dict(_rule_registry())
+
+
 def list_rule_descriptors() -> List[dict]:
-    registry = get_rule_registry()
-    return [
-        {"rule_id": rule_id, "description": rule.description}
-        for rule_id, rule in sorted(registry.items())
-    ]
+    return [{"rule_id": rule.rule_id, "description": rule.description} for rule in _sorted_rules()]
 
 
 def resolve_enabled_rules(enable: Optional[Iterable[str]]) -> List[ArchitectureRule]:
-    registry = get_rule_registry()
     if not enable:
-        return [registry[key] for key in sorted(registry.keys())]
+        return list(_sorted_rules())
 
+    registry = _rule_registry()
     selected: List[ArchitectureRule] = []
     for rule_id in enable:
         if rule_id not in registry:
-            available = ", ".join(sorted(registry.keys()))
+            available = ", ".join(rule.rule_id for rule in _sorted_rules())
             raise ValueError(f"Unknown architecture rule '{rule_id}'. Available: {available}")
         selected.append(registry[rule_id])
     return selected
@@ -1,27 +1,42 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence
 
 from paperfig.utils.types import ArchitectureCritiqueFinding
 
 
+# Shared read-only default for nested artifact lookups, so rules do not allocate `{}` per call.
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
 @dataclass
 class RuleContext:
+    # Artifact fields hold values parsed from raw bytes by utils.jsoncache and shared
+    # with other readers; rules must not mutate them.
     run_dir: Path
     repo_root: Path
     run_metadata: Dict[str, Any]
     inspect_data: Optional[Dict[str, Any]]
     plan_data: Optional[List[Dict[str, Any]]]
     docs_drift_report: Optional[Dict[str, Any]]
-    valid_template_ids: Set[str]
+    flows_root: Optional[Path] = None
+    template_ids_loader: Callable[[], FrozenSet[str]] = frozenset
+
+    @cached_property
+    def valid_template_ids(self) -> FrozenSet[str]:
+        # Resolved on first access so runs whose enabled rules never consult the
+        # template catalog skip loading it.
+        return self.template_ids_loader()
 
 
 RuleEvaluator = Callable[[RuleContext], Sequence[ArchitectureCritiqueFinding]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchitectureRule:
     rule_id: str
     description: str
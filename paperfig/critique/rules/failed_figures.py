@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List
 
-from paperfig.critique.rules.base import RuleContext
+from paperfig.critique.rules.base import EMPTY_MAPPING, RuleContext
 from paperfig.utils.types import ArchitectureCritiqueFinding
 
 
@@ -14,7 +14,7 @@ def evaluate(context: RuleContext) -> List[ArchitectureCritiqueFinding]:
     if context.inspect_data is None:
         return []
 
-    failed = context.inspect_data.get("aggregate", {}).get("failed_count", 0)
+    failed = context.inspect_data.get("aggregate", EMPTY_MAPPING).get("failed_count", 0)
     if not isinstance(failed, int) or failed <= 0:
         return []
 
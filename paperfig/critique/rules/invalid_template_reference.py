@@ -9,25 +9,27 @@ from paperfig.utils.types import ArchitectureCritiqueFinding
 RULE_ID = "invalid_template_reference"
 DESCRIPTION = "Ensure plan template IDs exist in the active template catalog."
 
-_ALLOWED_SPECIAL_TEMPLATE_IDS = {"heuristic_fallback", "manual", ""}
+_ALLOWED_SPECIAL_TEMPLATE_IDS = frozenset({"heuristic_fallback", "manual", ""})
 
 
 def evaluate(context: RuleContext) -> List[ArchitectureCritiqueFinding]:
-    if not context.plan_data or not context.valid_template_ids:
+    if not context.plan_data:
+        return []
+    valid_template_ids = context.valid_template_ids
+    if not valid_template_ids:
         return []
 
-    invalid = []
-    for entry in context.plan_data:
-        template_id = str(entry.get("template_id", ""))
-        if template_id in _ALLOWED_SPECIAL_TEMPLATE_IDS:
-            continue
-        if template_id not in context.valid_template_ids:
-            invalid.append(template_id)
-
+    # Catalog IDs are checked first: valid entries are the common case and cost one lookup.
+    invalid = {
+        template_id
+        for entry in context.plan_data
+        if (template_id := str(entry.get("template_id", ""))) not in valid_template_ids
+        and template_id not in _ALLOWED_SPECIAL_TEMPLATE_IDS
+    }
     if not invalid:
         return []
 
-    unique_invalid = sorted(set(invalid))
+    unique_invalid = sorted(invalid)
     return [
         ArchitectureCritiqueFinding(
             finding_id=RULE_ID,
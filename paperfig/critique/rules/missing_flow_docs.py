@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import List
 
 from paperfig.critique.rules.base import RuleContext
@@ -9,10 +10,14 @@ from paperfig.utils.types import ArchitectureCritiqueFinding
 RULE_ID = "missing_flow_docs"
 DESCRIPTION = "Verify every architecture flow folder contains README.md and diagram.mermaid."
 
+_REQUIRED_FLOW_FILES = ("README.md", "diagram.mermaid")
+
 
 def evaluate(context: RuleContext) -> List[ArchitectureCritiqueFinding]:
-    flows_root = context.repo_root / "docs" / "architecture" / "flows"
-    if not flows_root.exists():
+    flows_root = context.flows_root
+    if flows_root is None:
+        flows_root = context.repo_root / "docs" / "architecture" / "flows"
+    if not os.path.isdir(flows_root):
         return [
             ArchitectureCritiqueFinding(
                 finding_id=RULE_ID,
@@ -24,18 +29,15 @@ def evaluate(context: RuleContext) -> List[ArchitectureCritiqueFinding]:
             )
         ]
 
+    # One directory listing per flow folder instead of two stat calls per required file.
     missing_artifacts: List[str] = []
-    for subdir in sorted(flows_root.iterdir()):
-        if not subdir.is_dir():
-            continue
-        readme = subdir / "README.md"
-        diagram = subdir / "diagram.mermaid"
-        if not readme.exists() or not diagram.exists():
-            missing_parts = []
-            if not readme.exists():
-                missing_parts.append("README.md")
-            if not diagram.exists():
-                missing_parts.append("diagram.mermaid")
+    with os.scandir(flows_root) as entries:
+        subdirs = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+    for subdir in subdirs:
+        with os.scandir(subdir.path) as children:
+            names = {child.name for child in children}
+        missing_parts = [name for name in _REQUIRED_FLOW_FILES if name not in names]
+        if missing_parts:
             missing_artifacts.append(f"{subdir.name}: {', '.join(missing_parts)}")
 
     if not missing_artifacts:
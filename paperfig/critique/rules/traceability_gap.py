@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List
 
-from paperfig.critique.rules.base import RuleContext
+from paperfig.critique.rules.base import EMPTY_MAPPING, RuleContext
 from paperfig.utils.types import ArchitectureCritiqueFinding
 
 
@@ -14,7 +14,7 @@ def evaluate(context: RuleContext) -> List[ArchitectureCritiqueFinding]:
     if context.inspect_data is None:
         return []
 
-    avg_cov = context.inspect_data.get("aggregate", {}).get("avg_traceability_coverage")
+    avg_cov = context.inspect_data.get("aggregate", EMPTY_MAPPING).get("avg_traceability_coverage")
     if not isinstance(avg_cov, (int, float)) or avg_cov >= 0.8:
         return []
 
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-import time
+import os
+import shutil
 from pathlib import Path
 from typing import Any, Dict, List
 
+from paperfig.utils.timestamps import utc_now_iso
+
 from .manifest import DocsManifest, load_manifest
 from .renderer import render_hybrid_document
 
 
 def _validate_required_sections(text: str, required_sections: List[str]) -> List[str]:
-    missing: List[str] = []
-    for section in required_sections:
-        if section not in text:
-            missing.append(section)
-    return missing
+    return [section for section in required_sections if section not in text]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Write beside the target and swap it in, so an interrupted run never leaves a torn document.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def run_docs_regeneration(
@@ -24,13 +35,15 @@ def run_docs_regeneration(
     manifest: DocsManifest = load_manifest(manifest_path)
     doc_reports: List[Dict[str, Any]] = []
     drift_detected = False
+    # Rendered block bodies depend only on the manifest and repo_root, so share them across documents.
+    block_cache: Dict[str, str] = {}
 
     for entry in manifest.documents:
         doc_path = repo_root / entry.path
         report: Dict[str, Any] = {
             "path": entry.path,
             "mode": entry.mode,
-            "exists": doc_path.exists(),
+            "exists": True,
             "drift": False,
             "written": False,
             "missing_required_sections": [],
@@ -39,14 +52,19 @@ def run_docs_regeneration(
             "error": "",
         }
 
-        if not doc_path.exists():
-            report["error"] = "document_missing"
+        # Read directly instead of checking exists() first: one open, and no race in between.
+        try:
+            original = doc_path.read_text(encoding="utf-8")
+        except (OSError, ValueError) as exc:
+            # ValueError covers UnicodeDecodeError for documents that are not valid UTF-8.
+            missing = isinstance(exc, FileNotFoundError)
+            report["exists"] = not missing
+            report["error"] = "document_missing" if missing else str(exc)
             drift_detected = True
             doc_reports.append(report)
             continue
 
         try:
-            original = doc_path.read_text(encoding="utf-8")
             rendered = original
 
             if entry.mode in {"hybrid", "generated"}:
@@ -54,6 +72,7 @@ def run_docs_regeneration(
                     original,
                     manifest.auto_blocks,
                     repo_root,
+                    block_cache,
                 )
                 report["rendered_blocks"] = rendered_blocks
                 report["missing_block_configs"] = missing_block_configs
@@ -69,7 +88,7 @@ def run_docs_regeneration(
                 report["drift"] = True
                 drift_detected = True
                 if not check_only:
-                    doc_path.write_text(rendered, encoding="utf-8")
+                    _write_atomic(doc_path, rendered)
                     report["written"] = True
         except Exception as exc:  # pragma: no cover - defensive
             report["error"] = str(exc)
@@ -78,7 +97,7 @@ def run_docs_regeneration(
         doc_reports.append(report)
 
     return {
-        "checked_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "checked_at": utc_now_iso(),
         "manifest_path": str(manifest_path),
         "check_only": check_only,
         "drift_detected": drift_detected,
@@ -1,34 +1,110 @@
 from __future__ import annotations
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from paperfig.command_catalog import get_command_catalog
 from paperfig.templates.loader import load_template_catalog
+from paperfig.utils.types import FlowTemplateCatalog
 
 
+# Grammar of a complete block. Rendering walks blocks with iter_auto_blocks, which yields the same spans.
 AUTO_BLOCK_RE = re.compile(
     r"<!--\s*AUTO-GEN:START\s+(?P<block_id>[A-Za-z0-9_\-]+)\s*-->"
     r"(?P<body>.*?)"
     r"<!--\s*AUTO-GEN:END\s+(?P=block_id)\s*-->",
     re.DOTALL,
 )
+# Every AUTO_BLOCK_RE match contains this literal; a substring scan is far cheaper than the regex.
+AUTO_BLOCK_MARKER = "AUTO-GEN:START"
+_START_TAG_RE = re.compile(r"<!--\s*AUTO-GEN:START\s+(?P<block_id>[A-Za-z0-9_\-]+)\s*-->")
+
+
+@lru_cache(maxsize=64)
+def _end_tag_re(block_id: str) -> re.Pattern[str]:
+    return re.compile(r"<!--\s*AUTO-GEN:END\s+" + re.escape(block_id) + r"\s*-->")
+
+
+def iter_auto_blocks(text: str) -> Iterator[Tuple[int, int, str]]:
+    """
+    Yield (start, end, block_id) for the spans AUTO_BLOCK_RE.finditer would match.
+    Tags are matched separately, and an ID whose END tag is absent from the rest of the
+    text is never searched for again, so unclosed START tags cost linear time instead of
+    the full regex's quadratic rescans.
+    """
+    unclosed: Set[str] = set()
+    pos = 0
+    while True:
+        start = _START_TAG_RE.search(text, pos)
+        if start is None:
+            return
+        block_id = start.group("block_id")
+        end = None if block_id in unclosed else _end_tag_re(block_id).search(text, start.end())
+        if end is None:
+            unclosed.add(block_id)
+            pos = start.end()
+            continue
+        yield start.start(), end.end(), block_id
+        pos = end.end()
+
+
+def _template_files_stamp(template_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    with os.scandir(template_dir) as entries:
+        return tuple(
+            sorted(
+                (entry.name, stat.st_mtime_ns, stat.st_size)
+                for entry in entries
+                if entry.name.endswith(".yaml")
+                for stat in (entry.stat(),)
+            )
+        )
+
+
+def _format_block(lines: Iterable[str]) -> str:
+    return "\n" + "\n".join(lines) + "\n"
+
+
+def _format_template_catalog(catalog: FlowTemplateCatalog) -> str:
+    return _format_block(f"- `{tmpl.template_id}` ({tmpl.kind})" for tmpl in catalog.templates)
+
+
+@lru_cache(maxsize=1)
+def _cli_commands_block() -> str:
+    return _format_block(f"- `paperfig {command}`" for command in get_command_catalog())
+
+
+@lru_cache(maxsize=16)
+def _template_catalog_block_cached(
+    template_dir: str,
+    pack_id: str,
+    files_stamp: Tuple[Tuple[str, int, int], ...],
+) -> str:
+    del files_stamp
+    return _format_template_catalog(load_template_catalog(template_dir=Path(template_dir), pack_id=pack_id))
+
+
+def _template_catalog_block(template_dir: Path, pack_id: str) -> str:
+    # Reuse the rendered pack listing for the life of the process while its YAML files are unchanged.
+    try:
+        stamp = _template_files_stamp(template_dir)
+    except FileNotFoundError:
+        return _format_template_catalog(load_template_catalog(template_dir=template_dir, pack_id=pack_id))
+    return _template_catalog_block_cached(str(template_dir), pack_id, stamp)
 
 
 def render_auto_block(block_id: str, block_config: Dict[str, object], repo_root: Path) -> str:
     block_type = str(block_config.get("type", ""))
 
     if block_type == "cli_commands":
-        commands = get_command_catalog()
-        return "\n" + "\n".join(f"- `paperfig {command}`" for command in commands) + "\n"
+        return _cli_commands_block()
 
     if block_type == "flow_template_catalog":
         template_dir = repo_root / str(block_config.get("template_dir", "paperfig/templates/flows"))
         pack_id = str(block_config.get("pack_id", "expanded_v1"))
-        catalog = load_template_catalog(template_dir=template_dir, pack_id=pack_id)
-        lines = [f"- `{tmpl.template_id}` ({tmpl.kind})" for tmpl in catalog.templates]
-        return "\n" + "\n".join(lines) + "\n"
+        return _template_catalog_block(template_dir, pack_id)
 
     if block_type == "static":
         content = str(block_config.get("content", ""))
@@ -41,20 +117,38 @@ def render_hybrid_document(
     text: str,
     auto_blocks: Dict[str, Dict[str, object]],
     repo_root: Path,
+    block_cache: Optional[Dict[str, str]] = None,
 ) -> Tuple[str, List[str], List[str]]:
+    """
+    Re-render every AUTO-GEN block in text. When block_cache is given, block bodies
+    are looked up and stored there by block ID, so documents sharing a manifest
+    render each block once.
+    """
     rendered_blocks: List[str] = []
     missing_block_configs: List[str] = []
+    if AUTO_BLOCK_MARKER not in text:
+        return text, rendered_blocks, missing_block_configs
 
-    def _replace(match: re.Match[str]) -> str:
-        block_id = match.group("block_id")
+    parts: List[str] = []
+    pos = 0
+    for start, end, block_id in iter_auto_blocks(text):
         block_config = auto_blocks.get(block_id)
         if not isinstance(block_config, dict):
             missing_block_configs.append(block_id)
-            return match.group(0)
+            continue
 
-        rendered = render_auto_block(block_id, block_config, repo_root)
+        if block_cache is None:
+            rendered = render_auto_block(block_id, block_config, repo_root)
+        else:
+            rendered = block_cache.get(block_id)
+            if rendered is None:
+                rendered = block_cache[block_id] = render_auto_block(block_id, block_config, repo_root)
         rendered_blocks.append(block_id)
-        return f"<!-- AUTO-GEN:START {block_id} -->{rendered}<!-- AUTO-GEN:END {block_id} -->"
+        parts.append(text[pos:start])
+        parts.append(f"<!-- AUTO-GEN:START {block_id} -->{rendered}<!-- AUTO-GEN:END {block_id} -->")
+        pos = end
 
-    rendered_text = AUTO_BLOCK_RE.sub(_replace, text)
-    return rendered_text, rendered_blocks, missing_block_configs
+    if not parts:
+        return text, rendered_blocks, missing_block_configs
+    parts.append(text[pos:])
+    return "".join(parts), rendered_blocks, missing_block_configs
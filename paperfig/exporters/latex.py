@@ -2,6 +2,26 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# Captions come from plain-text plan titles; escape every LaTeX special in a single translate pass.
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+
+def latex_escape(text: str) -> str:
+    return text.translate(_LATEX_ESCAPES)
+
 
 def export_latex(figure_id: str, svg_filename: str, caption: str, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -9,7 +29,7 @@ def export_latex(figure_id: str, svg_filename: str, caption: str, output_path: P
         "\\begin{figure}[t]\n"
         "  \\centering\n"
         f"  \\includegraphics[width=\\linewidth]{{{svg_filename}}}\n"
-        f"  \\caption{{{caption}}}\n"
+        f"  \\caption{{{latex_escape(caption)}}}\n"
         f"  \\label{{fig:{figure_id}}}\n"
         "\\end{figure}\n"
     )
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+# Below this many figures, worker start-up (a fresh interpreter importing cairosvg) costs
+# more than rasterising serially.
+PARALLEL_MIN_FIGURES = 4
 
 
 def export_png(svg_path: Path, png_path: Path) -> None:
@@ -13,3 +21,34 @@ def export_png(svg_path: Path, png_path: Path) -> None:
 
     png_path.parent.mkdir(parents=True, exist_ok=True)
     cairosvg.svg2png(url=str(svg_path), write_to=str(png_path), background_color="transparent")
+
+
+def _export_png_pair(pair: Tuple[Path, Path]) -> Optional[str]:
+    try:
+        export_png(*pair)
+    except RuntimeError as exc:
+        return str(exc)
+    return None
+
+
+def export_png_batch(
+    pairs: Sequence[Tuple[Path, Path]],
+    max_workers: Optional[int] = None,
+) -> List[Optional[str]]:
+    """
+    Export each (svg_path, png_path) pair, returning None or the RuntimeError message per
+    pair in input order. cairo rasterisation is CPU-bound and holds the GIL, so larger
+    batches are spread across worker processes.
+    """
+    workers = min(len(pairs), max_workers or os.cpu_count() or 1)
+    if len(pairs) < PARALLEL_MIN_FIGURES or workers < 2:
+        return [_export_png_pair(pair) for pair in pairs]
+
+    try:
+        import cairosvg  # type: ignore  # noqa: F401
+    except Exception:  # pragma: no cover - optional dependency
+        # Every pair would fail the same way; skip starting workers just to report it.
+        return [_export_png_pair(pair) for pair in pairs]
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        return list(pool.map(_export_png_pair, pairs))
@@ -6,4 +6,4 @@ from pathlib import Path
 
 def export_svg(src: Path, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
+    shutil.copyfile(src, dest)
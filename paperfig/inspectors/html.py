@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import json
-import time
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, List
 
 from paperfig.contracts import load_contract, validate_contract_data
+from paperfig.utils.timestamps import utc_now_iso
 from paperfig.utils.types import InspectHtmlManifest
 
 
@@ -40,7 +40,7 @@ def build_html_inspector(run_dir: Path, run_root: Path) -> InspectHtmlManifest:
 
     manifest = InspectHtmlManifest(
         run_id=run_id,
-        generated_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        generated_at=utc_now_iso(),
         html_path=str(html_path),
         artifacts=[
             "inspect/index.html",
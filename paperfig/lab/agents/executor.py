@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import shlex
 import subprocess
-import time
 import sys
+import threading
+import time
+from functools import partial
 from shutil import which
-from typing import Tuple
+from typing import IO, List, Sequence, Tuple
 
 from paperfig.lab.policy import is_command_allowed
 from paperfig.lab.types import LabExperimentResult, LabPolicy
+from paperfig.utils.timestamps import utc_now_iso
+
+
+# Characters of stdout/stderr kept per stream; anything beyond is read and discarded.
+OUTPUT_CAPTURE_LIMIT = 10000
 
 
 class LabExecutionError(RuntimeError):
@@ -18,53 +25,99 @@ class LabExecutionError(RuntimeError):
 def execute_command(command: str, policy: LabPolicy) -> LabExperimentResult:
     normalized_command = _normalize_command(command)
     allowed, reason = is_command_allowed(normalized_command, policy)
-    started_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    started_at = utc_now_iso()
 
     if not allowed:
+        # Nothing was executed, so the rejection finishes when it starts.
         return LabExperimentResult(
             experiment_id="",
             status="failed",
             return_code=126,
             started_at=started_at,
-            finished_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            finished_at=started_at,
             stdout="",
             stderr="",
             policy_violation=reason,
         )
 
-    try:
-        completed = subprocess.run(  # noqa: S603
-            _command_tokens_for_exec(normalized_command),
-            capture_output=True,
-            text=True,
-            timeout=policy.max_runtime_seconds,
-            check=False,
-        )
-    except subprocess.TimeoutExpired as exc:
+    return_code, stdout, stderr, timed_out = _run_capped(
+        _command_tokens_for_exec(normalized_command),
+        timeout=policy.max_runtime_seconds,
+    )
+    if timed_out:
         return LabExperimentResult(
             experiment_id="",
             status="failed",
             return_code=124,
             started_at=started_at,
-            finished_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            stdout=(exc.stdout or "")[:10000],
-            stderr=(exc.stderr or "")[:10000],
+            finished_at=utc_now_iso(),
+            stdout=stdout,
+            stderr=stderr,
             policy_violation="execution_timeout",
         )
 
-    status = "completed" if completed.returncode == 0 else "failed"
+    status = "completed" if return_code == 0 else "failed"
     return LabExperimentResult(
         experiment_id="",
         status=status,
-        return_code=completed.returncode,
+        return_code=return_code,
         started_at=started_at,
-        finished_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-        stdout=completed.stdout[:10000],
-        stderr=completed.stderr[:10000],
+        finished_at=utc_now_iso(),
+        stdout=stdout,
+        stderr=stderr,
         policy_violation="",
     )
 
 
+def _read_capped(stream: IO[str], chunks: List[str]) -> None:
+    # Keep draining past the cap so the child never blocks on a full pipe.
+    kept = 0
+    with stream:
+        for chunk in iter(partial(stream.read, 4096), ""):
+            if kept < OUTPUT_CAPTURE_LIMIT:
+                chunk = chunk[: OUTPUT_CAPTURE_LIMIT - kept]
+                chunks.append(chunk)
+                kept += len(chunk)
+
+
+def _run_capped(tokens: Sequence[str], timeout: float) -> Tuple[int, str, str, bool]:
+    """
+    Run tokens like subprocess.run(capture_output=True, text=True), but hold at most
+    OUTPUT_CAPTURE_LIMIT characters of each stream in memory.
+    """
+    process = subprocess.Popen(  # noqa: S603
+        tokens,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stdout_chunks: List[str] = []
+    stderr_chunks: List[str] = []
+    readers = [
+        threading.Thread(target=_read_capped, args=(process.stdout, stdout_chunks), daemon=True),
+        threading.Thread(target=_read_capped, args=(process.stderr, stderr_chunks), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    # One deadline covers the child and the readers: a background process that inherited the
+    # pipes can keep them open after the child exits.
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+    for reader in readers:
+        reader.join(timeout=max(0.0, deadline - time.monotonic()))
+        if reader.is_alive():
+            timed_out = True
+    if timed_out and process.poll() is None:
+        process.kill()
+        process.wait()
+    return process.returncode, "".join(stdout_chunks), "".join(stderr_chunks), timed_out
+
+
 def _normalize_command(command: str) -> str:
     tokens = shlex.split(command)
     if not tokens:
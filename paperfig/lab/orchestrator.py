@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import json
 import time
 import uuid
-from dataclasses import asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -15,7 +13,9 @@ from paperfig.lab.agents.reviewer import review_experiment
 from paperfig.lab.policy import load_policy
 from paperfig.lab.registry import init_registry, load_index, save_index, upsert_experiment
 from paperfig.lab.types import LabExperimentResult, LabExperimentSpec
+from paperfig.utils.fastjson import loads, write_indented
 from paperfig.utils.structured_data import dump_structured_data, load_structured_file
+from paperfig.utils.timestamps import utc_now_iso
 
 
 class LabOrchestrator:
@@ -73,20 +73,20 @@ class LabOrchestrator:
             status="proposed",
             metadata={
                 "lab_run_id": run_id,
-                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "created_at": utc_now_iso(),
             },
         )
 
         exp_dir = experiments_dir / experiment_id
         exp_dir.mkdir(parents=True, exist_ok=True)
-        (exp_dir / "spec.yaml").write_text(dump_structured_data(asdict(spec), as_yaml=True), encoding="utf-8")
+        (exp_dir / "spec.yaml").write_text(dump_structured_data(spec_to_dict(spec), as_yaml=True), encoding="utf-8")
 
         upsert_experiment(run_dir, experiment_id, {
             "experiment_id": experiment_id,
             "status": "proposed",
             "source_run_id": source_run_id,
             "topic": topic,
-            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "updated_at": utc_now_iso(),
         })
 
         return spec
@@ -105,17 +105,20 @@ class LabOrchestrator:
         result = execute_command(spec.command, policy)
         result.experiment_id = experiment_id
 
-        (exp_dir / "execution_log.json").write_text(json.dumps(asdict(result), indent=2), encoding="utf-8")
+        write_indented(exp_dir / "execution_log.json", result_to_dict(result))
 
         spec.status = "completed" if result.status == "completed" else "failed"
-        (exp_dir / "spec.yaml").write_text(dump_structured_data(asdict(spec), as_yaml=True), encoding="utf-8")
+        # Only the status changed; rewrite the mapping already parsed from disk rather than
+        # rebuilding (and deep-copying) it from the dataclass.
+        spec_data["status"] = spec.status
+        spec_path.write_text(dump_structured_data(spec_data, as_yaml=True), encoding="utf-8")
 
         upsert_experiment(run_dir, experiment_id, {
             "experiment_id": experiment_id,
             "status": spec.status,
             "source_run_id": spec.source_run_id,
             "topic": spec.topic,
-            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "updated_at": utc_now_iso(),
         })
 
         return result
@@ -131,7 +134,7 @@ class LabOrchestrator:
 
         spec_data = load_structured_file(spec_path)
         spec = LabExperimentSpec(**spec_data)
-        result_data = json.loads(execution_path.read_text(encoding="utf-8"))
+        result_data = loads(execution_path.read_bytes())
         result = LabExperimentResult(**result_data)
 
         review = review_experiment(spec, result)
@@ -140,14 +143,14 @@ class LabOrchestrator:
             audit_report = run_reproducibility_audit(self.runs_root / spec.source_run_id, mode="soft")
             review["repro_audit"] = report_to_dict(audit_report)
 
-        (exp_dir / "review.json").write_text(json.dumps(review, indent=2), encoding="utf-8")
+        write_indented(exp_dir / "review.json", review)
 
         upsert_experiment(run_dir, experiment_id, {
             "experiment_id": experiment_id,
             "status": "reviewed",
             "source_run_id": spec.source_run_id,
             "topic": spec.topic,
-            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "updated_at": utc_now_iso(),
         })
 
         return review
@@ -169,3 +172,30 @@ class LabOrchestrator:
             "counts": counts,
             "experiments": experiments,
         }
+
+
+def spec_to_dict(spec: LabExperimentSpec) -> Dict[str, object]:
+    # Equivalent to dataclasses.asdict without its recursive deepcopy.
+    return {
+        "experiment_id": spec.experiment_id,
+        "topic": spec.topic,
+        "source_run_id": spec.source_run_id,
+        "hypothesis": spec.hypothesis,
+        "command": spec.command,
+        "status": spec.status,
+        "metadata": dict(spec.metadata),
+    }
+
+
+def result_to_dict(result: LabExperimentResult) -> Dict[str, object]:
+    # Equivalent to dataclasses.asdict; every field is a scalar, so no copying is needed.
+    return {
+        "experiment_id": result.experiment_id,
+        "status": result.status,
+        "return_code": result.return_code,
+        "started_at": result.started_at,
+        "finished_at": result.finished_at,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "policy_violation": result.policy_violation,
+    }
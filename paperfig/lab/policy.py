@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import re
 import shlex
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, FrozenSet, Optional, Pattern, Tuple
 
 from paperfig.lab.types import LabPolicy
 from paperfig.utils.structured_data import load_structured_file
@@ -14,18 +16,52 @@ def load_policy(path: Path) -> LabPolicy:
         raise RuntimeError(f"Policy file {path} must contain a mapping/object.")
 
     return LabPolicy(
-        allowed_prefixes=[str(item) for item in data.get("allowed_prefixes", [])],
+        allowed_prefixes=frozenset(str(item) for item in data.get("allowed_prefixes", [])),
         blocked_patterns=[str(item) for item in data.get("blocked_patterns", [])],
         max_runtime_seconds=int(data.get("max_runtime_seconds", 1200)),
         max_parallel_experiments=int(data.get("max_parallel_experiments", 1)),
     )
 
 
+@lru_cache(maxsize=8)
+def _blocked_matcher(blocked_patterns: Tuple[str, ...]) -> Optional[Tuple[Pattern[str], Dict[str, str]]]:
+    # One alternation scans the command once instead of once per pattern. Longer
+    # patterns go first so a match reports the most specific pattern at that position.
+    if not blocked_patterns:
+        return None
+    originals: Dict[str, str] = {}
+    for pattern in blocked_patterns:
+        originals.setdefault(pattern.lower(), pattern)
+    alternation = "|".join(re.escape(lowered) for lowered in sorted(originals, key=len, reverse=True))
+    return re.compile(alternation), originals
+
+
+_QUOTING_CHARS = frozenset("'\"\\")
+
+
+@lru_cache(maxsize=8)
+def _allowed_starts(allowed_prefixes: FrozenSet[str]) -> Tuple[str, ...]:
+    # Only prefixes that shlex keeps as one unchanged token can be matched as plain text.
+    return tuple(
+        f"{prefix} "
+        for prefix in allowed_prefixes
+        if prefix and not _QUOTING_CHARS.intersection(prefix) and shlex.split(prefix) == [prefix]
+    )
+
+
 def is_command_allowed(command: str, policy: LabPolicy) -> Tuple[bool, str]:
-    lowered = command.lower()
-    for pattern in policy.blocked_patterns:
-        if pattern.lower() in lowered:
-            return False, f"Command blocked by pattern: {pattern}"
+    matcher = _blocked_matcher(tuple(policy.blocked_patterns))
+    if matcher is not None:
+        regex, originals = matcher
+        match = regex.search(command.lower())
+        if match is not None:
+            return False, f"Command blocked by pattern: {originals[match.group(0)]}"
+
+    # Without quoting characters shlex splits on whitespace alone, so a single-token allowed
+    # prefix followed by a space is exactly the first token and the common case skips tokenizing.
+    if policy.allowed_prefixes and _QUOTING_CHARS.isdisjoint(command):
+        if f"{command} ".startswith(_allowed_starts(frozenset(policy.allowed_prefixes))):
+            return True, "allowed"
 
     tokens = shlex.split(command)
     if not tokens:
@@ -1,32 +1,36 @@
 from __future__ import annotations
 
-import json
-import time
 from pathlib import Path
 from typing import Any, Dict
 
+from paperfig.utils.fastjson import loads, write_indented
+from paperfig.utils.timestamps import utc_now_iso
+
 
 def init_registry(registry_dir: Path) -> None:
     registry_dir.mkdir(parents=True, exist_ok=True)
     index_path = registry_dir / "index.json"
     if not index_path.exists():
         index = {
-            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "created_at": utc_now_iso(),
             "experiments": {},
         }
-        index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        write_indented(index_path, index)
 
 
 def load_index(registry_dir: Path) -> Dict[str, Any]:
     index_path = registry_dir / "index.json"
-    if not index_path.exists():
+    try:
+        raw = index_path.read_bytes()
+    except FileNotFoundError:
         init_registry(registry_dir)
-    return json.loads(index_path.read_text(encoding="utf-8"))
+        raw = index_path.read_bytes()
+    return loads(raw)
 
 
 def save_index(registry_dir: Path, index: Dict[str, Any]) -> None:
     index_path = registry_dir / "index.json"
-    index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    write_indented(index_path, index)
 
 
 def upsert_experiment(registry_dir: Path, experiment_id: str, payload: Dict[str, Any]) -> None:
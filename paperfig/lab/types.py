@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 
 @dataclass
 class LabPolicy:
-    allowed_prefixes: List[str] = field(default_factory=list)
+    allowed_prefixes: FrozenSet[str] = frozenset()
     blocked_patterns: List[str] = field(default_factory=list)
     max_runtime_seconds: int = 1200
     max_parallel_experiments: int = 1
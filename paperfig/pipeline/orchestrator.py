@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import filecmp
 import hashlib
-import json
+import os
 import shutil
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import asdict
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from paperfig.agents.architecture_critic import ArchitectureCriticAgent, report_to_dict as architecture_report_to_dict
 from paperfig.agents.critic import CriticAgent
@@ -18,17 +24,53 @@ from paperfig.audits.reproducibility import run_reproducibility_audit
 from paperfig.contracts import build_figure_contract, load_contract, validate_contract_data, write_contract
 from paperfig.docsgen import run_docs_regeneration
 from paperfig.exporters.latex import export_latex
-from paperfig.exporters.png import export_png
+from paperfig.exporters.png import export_png_batch
 from paperfig.exporters.svg import export_svg
 from paperfig.inspectors import build_html_inspector
 from paperfig.journals import journal_profile_to_dict, load_journal_profile
 from paperfig.plugins.registry import list_plugins
 from paperfig.templates.loader import load_template_catalog
 from paperfig.utils.config import config_hash, load_config
+from paperfig.utils.fastjson import loads, write_indented
+from paperfig.utils.jsoncache import load_json_cached
 from paperfig.utils.pdf_parser import parse_paper
 from paperfig.utils.style_refs import load_style_refs
+from paperfig.utils.timestamps import utc_now_iso
 from paperfig.utils.types import CritiqueReport, FigurePlan, JournalProfile, PaperContent
 
+# Sidecar holding the fingerprint of the run files inspect.json was built from.
+INSPECT_FINGERPRINT_FILE = "inspect.fingerprint"
+
+# Serializes contrib.log appends when figures are generated on worker threads.
+_CONTRIB_LOG_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _load_plan_cached(
+    path_str: str, mtime_ns: int, size: int, inode: int
+) -> Tuple[Tuple[dict, ...], Mapping[str, dict]]:
+    del mtime_ns, size, inode
+    plan_data = load_json_cached(Path(path_str))
+    if not isinstance(plan_data, list):
+        raise ValueError(f"{path_str} must contain a list of figure plans.")
+    by_id = {item["figure_id"]: item for item in plan_data if isinstance(item, dict) and "figure_id" in item}
+    return tuple(plan_data), MappingProxyType(by_id)
+
+
+def _load_plan(run_dir: Path) -> Optional[Tuple[Tuple[dict, ...], Mapping[str, dict]]]:
+    """
+    Return (plan entries, entries by figure_id) for a run's plan.json, or None when the run has
+    no plan. Only dict entries with a figure_id are indexed, and ValueError is raised when the
+    file is not a JSON list. Parsed plans are shared until the file changes and must be treated
+    as read-only.
+    """
+    plan_path = run_dir / "plan.json"
+    try:
+        stat = os.stat(plan_path)
+    except FileNotFoundError:
+        return None
+    return _load_plan_cached(str(plan_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
 
 class Orchestrator:
     def __init__(
@@ -51,7 +93,17 @@ class Orchestrator:
         self.config_path = config_path
 
         self.config = load_config(config_path)
-        self.config_fingerprint = config_hash(self.config)
+        # Opt-in: figures are generated and exported concurrently only when the config asks for more than one worker.
+        parallelism_cfg = self.config.get("parallelism", {})
+        self.figure_workers = max(1, int(parallelism_cfg.get("figure_workers", 1)))
+        self.export_workers = max(1, int(parallelism_cfg.get("export_workers", 1)))
+        # Opt-in: stop iterating a failing figure once its score has not improved by more than
+        # min_delta for `patience` consecutive iterations (0 keeps running to max_iterations).
+        early_exit_cfg = self.config.get("iteration_early_exit", {})
+        self.early_exit_patience = max(0, int(early_exit_cfg.get("patience", 0)))
+        self.early_exit_min_delta = float(early_exit_cfg.get("min_delta", 1e-3))
+        # Opt-in: skip scanning the SVG when faithfulness alone already fails the figure.
+        self.critic_short_circuit = bool(self.config.get("critic", {}).get("short_circuit", False))
 
         template_cfg = self.config.get("templates", {})
         self.template_pack = template_pack or str(template_cfg.get("active_pack", "expanded_v1"))
@@ -84,13 +136,30 @@ class Orchestrator:
             if self.journal_profile.template_pack:
                 self.template_pack = self.journal_profile.template_pack
 
-        self.planner = PlannerAgent(template_dir=self.template_dir, template_pack=self.template_pack)
-        self.generator = GeneratorAgent()
-        self.critic = CriticAgent(
+    @cached_property
+    def config_fingerprint(self) -> str:
+        return config_hash(self.config)
+
+    # Agents are built on first use: diff, inspect and export never need them.
+    @cached_property
+    def planner(self) -> PlannerAgent:
+        return PlannerAgent(template_dir=self.template_dir, template_pack=self.template_pack)
+
+    @cached_property
+    def generator(self) -> GeneratorAgent:
+        return GeneratorAgent()
+
+    @cached_property
+    def critic(self) -> CriticAgent:
+        return CriticAgent(
             threshold=self.quality_threshold,
             dimension_threshold=self.dimension_threshold,
+            short_circuit=self.critic_short_circuit,
         )
-        self.architecture_critic = ArchitectureCriticAgent(
+
+    @cached_property
+    def architecture_critic(self) -> ArchitectureCriticAgent:
+        return ArchitectureCriticAgent(
             repo_root=Path("."),
             template_dir=self.template_dir,
             default_template_pack=self.template_pack,
@@ -127,10 +196,14 @@ class Orchestrator:
         if not paper_path.exists():
             raise FileNotFoundError(f"Source paper path not found for rerun: {paper_path}")
 
-        plan_data = self._read_json(source_run_dir / "plan.json")
-        if not isinstance(plan_data, list):
+        try:
+            plan_data = _load_plan(source_run_dir)
+        except (OSError, ValueError):
+            # ValueError also covers JSON decode errors from either parser.
+            plan_data = None
+        if plan_data is None:
             raise RuntimeError(f"Run {source_run_id} is missing a valid plan.json.")
-        plan = [self._plan_from_dict(item) for item in plan_data if isinstance(item, dict)]
+        plan = [self._plan_from_dict(item) for item in plan_data[0] if isinstance(item, dict)]
         if not plan:
             raise RuntimeError(f"Run {source_run_id} has an empty plan.json; cannot rerun deterministically.")
 
@@ -210,7 +283,7 @@ class Orchestrator:
         report = {
             "run_id_1": run_id_1,
             "run_id_2": run_id_2,
-            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "generated_at": utc_now_iso(),
             "metrics": metrics,
             "changed_figures": changed_figures,
             "changed_artifacts": changed_artifacts,
@@ -292,7 +365,7 @@ class Orchestrator:
             "paper_v2": str(paper_v2),
             "run_id_v1": run_id_v1,
             "run_id_v2": run_id_v2,
-            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "generated_at": utc_now_iso(),
             "metrics": metrics,
             "invariants": invariants,
             "summary": summary,
@@ -318,7 +391,6 @@ class Orchestrator:
         exports_dir = run_dir / "exports"
         contrib_log_path = run_dir / "contrib.log"
         template_map = self._load_template_map()
-        contract_errors: Dict[str, List[str]] = {}
 
         figures_dir.mkdir(parents=True, exist_ok=True)
         exports_dir.mkdir(parents=True, exist_ok=True)
@@ -336,111 +408,41 @@ class Orchestrator:
             self._write_planner_notes(run_dir, list(plan))
             self._append_contrib_log(contrib_log_path, f"planner completed figures={len(plan)}")
 
-        captions: List[str] = []
-        traceability_records: List[dict] = []
-
-        for figure_plan in plan:
-            figure_dir = figures_dir / figure_plan.figure_id
-            figure_dir.mkdir(parents=True, exist_ok=True)
-            template = template_map.get(figure_plan.template_id)
-            contract = build_figure_contract(run_id, figure_plan, template)
-            write_contract(figure_dir / "contract.json", contract)
-            errors = validate_contract_data(asdict(contract))
-            contract_errors[figure_plan.figure_id] = errors
-            if contrib and errors:
-                self._append_contrib_log(
-                    contrib_log_path,
-                    f"contract errors figure={figure_plan.figure_id} issues={len(errors)}",
-                )
-            accepted = False
-            last_report: CritiqueReport | None = None
-            critique_feedback: dict | None = None
-
-            for iteration in range(1, self.max_iterations + 1):
-                iter_dir = figure_dir / f"iter_{iteration}"
-                if contrib:
-                    self._append_contrib_log(
-                        contrib_log_path,
-                        f"generate figure={figure_plan.figure_id} iteration={iteration}",
-                    )
-                candidate = self.generator.generate(
-                    figure_plan,
-                    paper,
-                    iter_dir,
-                    iteration,
-                    style_refs=style_refs,
-                    critique_feedback=critique_feedback,
-                )
-                report = self.critic.critique(Path(candidate.svg_path), figure_plan, paper)
-                errors = contract_errors.get(figure_plan.figure_id, [])
-                if errors:
-                    self._apply_contract_validation(report, errors)
-                last_report = report
-                critique_feedback = {
-                    "previous_score": report.score,
-                    "issues": report.issues,
-                    "recommendations": report.recommendations,
-                    "failed_dimensions": report.failed_dimensions,
-                }
-
-                critique_path = iter_dir / "critique.json"
-                with open(critique_path, "w", encoding="utf-8") as handle:
-                    json.dump(asdict(report), handle, indent=2)
-                if contrib:
-                    self._write_critic_notes(iter_dir, report)
-                    self._append_contrib_log(
-                        contrib_log_path,
-                        f"critique figure={figure_plan.figure_id} iteration={iteration} "
-                        f"score={report.score} passed={report.passed}",
-                    )
-
-                if report.passed:
-                    final_dir = figure_dir / "final"
-                    final_dir.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(candidate.svg_path, final_dir / "figure.svg")
-                    shutil.copy2(candidate.element_metadata_path, final_dir / "element_metadata.json")
-                    shutil.copy2(candidate.traceability_path, final_dir / "traceability.json")
-                    contract_path = figure_dir / "contract.json"
-                    if contract_path.exists():
-                        shutil.copy2(contract_path, final_dir / "contract.json")
-                    accepted = True
-                    if contrib:
-                        self._append_contrib_log(
-                            contrib_log_path,
-                            f"accepted figure={figure_plan.figure_id} iteration={iteration}",
-                        )
-                    break
-
-            if not accepted and last_report:
-                final_dir = figure_dir / "final"
-                final_dir.mkdir(parents=True, exist_ok=True)
-                # Fall back to the last iteration artifacts for traceability.
-                last_iter_dir = figure_dir / f"iter_{self.max_iterations}"
-                shutil.copy2(last_iter_dir / "figure.svg", final_dir / "figure.svg")
-                shutil.copy2(last_iter_dir / "element_metadata.json", final_dir / "element_metadata.json")
-                shutil.copy2(last_iter_dir / "traceability.json", final_dir / "traceability.json")
-                contract_path = figure_dir / "contract.json"
-                if contract_path.exists():
-                    shutil.copy2(contract_path, final_dir / "contract.json")
-                if contrib:
-                    self._append_contrib_log(
-                        contrib_log_path,
-                        f"fallback-final figure={figure_plan.figure_id} iteration={self.max_iterations}",
-                    )
-
-            captions.append(f"{figure_plan.figure_id}: {figure_plan.title} - {figure_plan.justification}")
-
-            traceability_path = figure_dir / "final" / "traceability.json"
-            if traceability_path.exists():
-                with open(traceability_path, "r", encoding="utf-8") as handle:
-                    traceability_records.append(json.load(handle))
-
+        run_figure = partial(
+            self._run_single_figure,
+            run_id=run_id,
+            paper=paper,
+            figures_dir=figures_dir,
+            template_map=template_map,
+            style_refs=style_refs,
+            contrib=contrib,
+            contrib_log_path=contrib_log_path,
+        )
+        workers = min(self.figure_workers, len(plan))
+        if workers > 1:
+            # Build the lazy agents here so worker threads share a single instance of each.
+            _ = (self.generator, self.critic)
         captions_path = run_dir / "captions.txt"
-        captions_path.write_text("\n".join(captions), encoding="utf-8")
+        # Captions stream into a temp file that only replaces captions.txt once every figure is
+        # done, so a failing figure never leaves a truncated captions.txt behind.
+        partial_captions_path = captions_path.with_name(captions_path.name + ".tmp")
+        traceability_records: List[dict] = []
+        # Figures write to disjoint directories; map() keeps results in plan order.
+        pool_context = ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+        try:
+            with pool_context as pool, open(partial_captions_path, "w", encoding="utf-8") as captions_handle:
+                results = pool.map(run_figure, plan) if pool else map(run_figure, plan)
+                for index, (caption, record) in enumerate(results):
+                    captions_handle.write(f"\n{caption}" if index else caption)
+                    if record is not None:
+                        traceability_records.append(record)
+        except BaseException:
+            partial_captions_path.unlink(missing_ok=True)
+            raise
+        os.replace(partial_captions_path, captions_path)
 
         traceability_path = run_dir / "traceability.json"
-        with open(traceability_path, "w", encoding="utf-8") as handle:
-            json.dump({"figures": traceability_records}, handle, indent=2)
+        write_indented(traceability_path, {"figures": traceability_records})
 
         # Finalization order: inspect -> docs check/regeneration -> architecture critique -> reproducibility audit.
         self._write_inspect_snapshot(run_id=run_id)
@@ -493,6 +495,124 @@ class Orchestrator:
 
         return run_id
 
+    def _run_single_figure(
+        self,
+        figure_plan: FigurePlan,
+        run_id: str,
+        paper: PaperContent,
+        figures_dir: Path,
+        template_map: Dict[str, object],
+        style_refs: dict,
+        contrib: bool,
+        contrib_log_path: Path,
+    ) -> Tuple[str, Optional[dict]]:
+        figure_dir = figures_dir / figure_plan.figure_id
+        figure_dir.mkdir(parents=True, exist_ok=True)
+        template = template_map.get(figure_plan.template_id)
+        contract = build_figure_contract(run_id, figure_plan, template)
+        write_contract(figure_dir / "contract.json", contract)
+        contract_errors = validate_contract_data(asdict(contract))
+        if contrib and contract_errors:
+            self._append_contrib_log(
+                contrib_log_path,
+                f"contract errors figure={figure_plan.figure_id} issues={len(contract_errors)}",
+            )
+        accepted = False
+        last_report: CritiqueReport | None = None
+        last_iteration = 0
+        stalled_iterations = 0
+        critique_feedback: dict | None = None
+
+        for iteration in range(1, self.max_iterations + 1):
+            iter_dir = figure_dir / f"iter_{iteration}"
+            if contrib:
+                self._append_contrib_log(
+                    contrib_log_path,
+                    f"generate figure={figure_plan.figure_id} iteration={iteration}",
+                )
+            candidate = self.generator.generate(
+                figure_plan,
+                paper,
+                iter_dir,
+                iteration,
+                style_refs=style_refs,
+                critique_feedback=critique_feedback,
+            )
+            report = self.critic.critique(Path(candidate.svg_path), figure_plan, paper)
+            if contract_errors:
+                self._apply_contract_validation(report, contract_errors)
+            if last_report is not None and report.score <= last_report.score + self.early_exit_min_delta:
+                stalled_iterations += 1
+            else:
+                stalled_iterations = 0
+            last_report = report
+            last_iteration = iteration
+            critique_feedback = {
+                "previous_score": report.score,
+                "issues": report.issues,
+                "recommendations": report.recommendations,
+                "failed_dimensions": report.failed_dimensions,
+            }
+
+            critique_path = iter_dir / "critique.json"
+            write_indented(critique_path, report)
+            if contrib:
+                self._write_critic_notes(iter_dir, report)
+                self._append_contrib_log(
+                    contrib_log_path,
+                    f"critique figure={figure_plan.figure_id} iteration={iteration} "
+                    f"score={report.score} passed={report.passed}",
+                )
+
+            if report.passed:
+                final_dir = figure_dir / "final"
+                final_dir.mkdir(parents=True, exist_ok=True)
+                self._promote(candidate.svg_path, final_dir / "figure.svg")
+                self._promote(candidate.element_metadata_path, final_dir / "element_metadata.json")
+                self._promote(candidate.traceability_path, final_dir / "traceability.json")
+                contract_path = figure_dir / "contract.json"
+                if contract_path.exists():
+                    self._promote(contract_path, final_dir / "contract.json")
+                accepted = True
+                if contrib:
+                    self._append_contrib_log(
+                        contrib_log_path,
+                        f"accepted figure={figure_plan.figure_id} iteration={iteration}",
+                    )
+                break
+
+            if self.early_exit_patience and stalled_iterations >= self.early_exit_patience:
+                if contrib:
+                    self._append_contrib_log(
+                        contrib_log_path,
+                        f"score plateau figure={figure_plan.figure_id} iteration={iteration}",
+                    )
+                break
+
+        if not accepted and last_report:
+            final_dir = figure_dir / "final"
+            final_dir.mkdir(parents=True, exist_ok=True)
+            # Fall back to the last iteration artifacts for traceability.
+            last_iter_dir = figure_dir / f"iter_{last_iteration}"
+            self._promote(last_iter_dir / "figure.svg", final_dir / "figure.svg")
+            self._promote(last_iter_dir / "element_metadata.json", final_dir / "element_metadata.json")
+            self._promote(last_iter_dir / "traceability.json", final_dir / "traceability.json")
+            contract_path = figure_dir / "contract.json"
+            if contract_path.exists():
+                self._promote(contract_path, final_dir / "contract.json")
+            if contrib:
+                self._append_contrib_log(
+                    contrib_log_path,
+                    f"fallback-final figure={figure_plan.figure_id} iteration={last_iteration}",
+                )
+
+        caption = f"{figure_plan.figure_id}: {figure_plan.title} - {figure_plan.justification}"
+        traceability_record = None
+        traceability_path = figure_dir / "final" / "traceability.json"
+        if traceability_path.exists():
+            traceability_record = loads(traceability_path.read_bytes())
+        return caption, traceability_record
+
     def docs_regenerate(
         self,
         check_only: bool = False,
@@ -567,67 +687,32 @@ class Orchestrator:
             "warnings": [],
         }
 
-        plan_path = run_dir / "plan.json"
-        if plan_path.exists():
-            plan_data = json.loads(plan_path.read_text(encoding="utf-8"))
-            plan_by_id = {item["figure_id"]: item for item in plan_data}
-        else:
-            plan_by_id = {}
+        plan = _load_plan(run_dir)
+        plan_by_id: Mapping[str, dict] = plan[1] if plan else {}
 
         figures_dir = run_dir / "figures"
         if figures_dir.exists():
-            for figure_dir in figures_dir.iterdir():
-                final_dir = figure_dir / "final"
-                svg_path = final_dir / "figure.svg"
-                if not svg_path.exists():
-                    continue
-
-                figure_id = figure_dir.name
-                target_svg = output_dir / f"{figure_id}.svg"
-                export_svg(svg_path, target_svg)
-                figure_report = {
-                    "figure_id": figure_id,
-                    "svg": str(target_svg),
-                    "png": None,
-                    "latex": str(output_dir / f"{figure_id}.tex"),
-                }
-
-                try:
-                    png_path = output_dir / f"{figure_id}.png"
-                    export_png(svg_path, png_path)
-                    figure_report["png"] = str(png_path)
-                except RuntimeError as exc:
-                    message = f"PNG export skipped for {figure_id}: {exc}"
-                    if "paperfig doctor --fix png" not in message:
-                        message = f"{message} Run: paperfig doctor --fix png"
-                    export_report["warnings"].append(message)
-
-                plan_entry = plan_by_id.get(figure_id, {})
-                caption = plan_entry.get("title", figure_id)
-                export_latex(figure_id, f"{figure_id}.svg", caption, output_dir / f"{figure_id}.tex")
-
-                traceability_src = final_dir / "traceability.json"
-                if traceability_src.exists():
-                    shutil.copy2(traceability_src, output_dir / f"{figure_id}.traceability.json")
-
-                contract_src = figure_dir / "contract.json"
-                contract_payload = load_contract(contract_src) if contract_src.exists() else None
-                contract_errors: List[str] = []
-                if isinstance(contract_payload, dict):
-                    contract_errors = validate_contract_data(contract_payload)
-                else:
-                    contract_errors = ["contract.json: missing or invalid"]
-
-                figure_report["contract"] = str(contract_src) if contract_src.exists() else None
-                figure_report["contract_valid"] = not contract_errors
-                figure_report["contract_errors"] = contract_errors
-                if contract_src.exists():
-                    shutil.copy2(contract_src, output_dir / f"{figure_id}.contract.json")
-                if contract_errors:
-                    export_report["warnings"].append(
-                        f"Contract validation failed for {figure_id}: {', '.join(contract_errors)}"
-                    )
+            figure_dirs = sorted(
+                figure_dir for figure_dir in figures_dir.iterdir() if (figure_dir / "final" / "figure.svg").exists()
+            )
+            # Rasterise every figure up front so the PNG exports can run in parallel.
+            png_errors = export_png_batch(
+                [
+                    (figure_dir / "final" / "figure.svg", output_dir / f"{figure_dir.name}.png")
+                    for figure_dir in figure_dirs
+                ]
+            )
+            export_figure = partial(self._export_figure, output_dir=output_dir, plan_by_id=plan_by_id)
+            workers = min(self.export_workers, len(figure_dirs))
+            if workers > 1:
+                # Each figure writes its own files; map() keeps the report in figure order.
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(export_figure, figure_dirs, png_errors))
+            else:
+                results = [export_figure(figure_dir, png_error) for figure_dir, png_error in zip(figure_dirs, png_errors)]
+            for figure_report, warnings in results:
                 export_report["figures"].append(figure_report)
+                export_report["warnings"].extend(warnings)
 
         captions_src = run_dir / "captions.txt"
         if captions_src.exists():
@@ -637,11 +722,63 @@ class Orchestrator:
         if traceability_src.exists():
             shutil.copy2(traceability_src, output_dir / "traceability.json")
 
-        with open(output_dir / "export_report.json", "w", encoding="utf-8") as handle:
-            json.dump(export_report, handle, indent=2)
+        write_indented(output_dir / "export_report.json", export_report)
 
         return output_dir
 
+    def _export_figure(
+        self,
+        figure_dir: Path,
+        png_error: Optional[str],
+        output_dir: Path,
+        plan_by_id: Mapping[str, dict],
+    ) -> Tuple[dict, List[str]]:
+        warnings: List[str] = []
+        final_dir = figure_dir / "final"
+        svg_path = final_dir / "figure.svg"
+        figure_id = figure_dir.name
+        target_svg = output_dir / f"{figure_id}.svg"
+        export_svg(svg_path, target_svg)
+        figure_report = {
+            "figure_id": figure_id,
+            "svg": str(target_svg),
+            "png": None,
+            "latex": str(output_dir / f"{figure_id}.tex"),
+        }
+
+        if png_error is None:
+            figure_report["png"] = str(output_dir / f"{figure_id}.png")
+        else:
+            message = f"PNG export skipped for {figure_id}: {png_error}"
+            if "paperfig doctor --fix png" not in message:
+                message = f"{message} Run: paperfig doctor --fix png"
+            warnings.append(message)
+
+        plan_entry = plan_by_id.get(figure_id, {})
+        caption = plan_entry.get("title", figure_id)
+        export_latex(figure_id, f"{figure_id}.svg", caption, output_dir / f"{figure_id}.tex")
+
+        traceability_src = final_dir / "traceability.json"
+        if traceability_src.exists():
+            shutil.copy2(traceability_src, output_dir / f"{figure_id}.traceability.json")
+
+        contract_src = figure_dir / "contract.json"
+        contract_payload = load_contract(contract_src) if contract_src.exists() else None
+        contract_errors: List[str] = []
+        if isinstance(contract_payload, dict):
+            contract_errors = validate_contract_data(contract_payload)
+        else:
+            contract_errors = ["contract.json: missing or invalid"]
+
+        figure_report["contract"] = str(contract_src) if contract_src.exists() else None
+        figure_report["contract_valid"] = not contract_errors
+        figure_report["contract_errors"] = contract_errors
+        if contract_src.exists():
+            shutil.copy2(contract_src, output_dir / f"{figure_id}.contract.json")
+        if contract_errors:
+            warnings.append(f"Contract validation failed for {figure_id}: {', '.join(contract_errors)}")
+        return figure_report, warnings
+
     def inspect(
         self,
         run_id: str,
@@ -654,6 +791,50 @@ class Orchestrator:
         if not run_dir.exists():
             raise FileNotFoundError(f"Run {run_id} not found in {self.run_root}")
 
+        full_summary = self._inspect_unfiltered(run_id, run_dir)
+        summary = dict(full_summary)
+        summary["warnings"] = list(full_summary.get("warnings", []))
+        if not (run_dir / "figures").exists():
+            return summary
+
+        figure_summaries = list(full_summary.get("figures", []))
+        figure_id_filter = figure_id
+        if figure_id_filter:
+            figure_summaries = [item for item in figure_summaries if item.get("figure_id") == figure_id_filter]
+        if failures_only:
+            figure_summaries = [item for item in figure_summaries if not item.get("final_passed")]
+        if min_score is not None:
+            figure_summaries = [
+                item
+                for item in figure_summaries
+                if isinstance(item.get("final_score"), (int, float)) and item["final_score"] >= min_score
+            ]
+        if failed_dimension:
+            target = failed_dimension.strip().lower()
+            figure_summaries = [
+                item
+                for item in figure_summaries
+                if any(str(dim).lower() == target for dim in (item.get("failed_dimensions") or []))
+            ]
+
+        summary["figures"] = figure_summaries
+        summary["aggregate"] = self._inspect_aggregate(figure_summaries)
+        return summary
+
+    def _inspect_unfiltered(self, run_id: str, run_dir: Path) -> dict:
+        # A finished run does not change, so the snapshot written at generate time is reused for
+        # as long as the files it was built from keep the fingerprint stored next to it.
+        try:
+            stored = (run_dir / INSPECT_FINGERPRINT_FILE).read_text(encoding="utf-8")
+        except OSError:
+            stored = None
+        if stored is not None and stored == self._inspect_fingerprint(run_dir):
+            cached = self._read_json(run_dir / "inspect.json")
+            if isinstance(cached, dict):
+                return cached
+        return self._collect_inspect(run_id, run_dir)
+
+    def _collect_inspect(self, run_id: str, run_dir: Path) -> dict:
         summary = {
             "run_id": run_id,
             "run_dir": str(run_dir),
@@ -666,17 +847,16 @@ class Orchestrator:
 
         run_meta_path = run_dir / "run.json"
         if run_meta_path.exists():
-            summary["metadata"] = json.loads(run_meta_path.read_text(encoding="utf-8"))
+            summary["metadata"] = loads(run_meta_path.read_bytes())
         else:
             summary["warnings"].append("Missing run metadata: run.json")
         run_max_iterations = int(summary["metadata"].get("max_iterations", self.max_iterations))
 
-        plan_path = run_dir / "plan.json"
-        plan_by_id: dict = {}
-        if plan_path.exists():
-            plan_data = json.loads(plan_path.read_text(encoding="utf-8"))
-            summary["plan_count"] = len(plan_data)
-            plan_by_id = {item["figure_id"]: item for item in plan_data}
+        plan = _load_plan(run_dir)
+        plan_by_id: Mapping[str, dict] = {}
+        if plan:
+            summary["plan_count"] = len(plan[0])
+            plan_by_id = plan[1]
         else:
             summary["warnings"].append("Missing plan: plan.json")
 
@@ -686,25 +866,28 @@ class Orchestrator:
             return summary
 
         figure_summaries = []
-        figure_id_filter = figure_id
-        for figure_dir in sorted(figures_dir.iterdir()):
-            if not figure_dir.is_dir():
-                continue
-            current_figure_id = figure_dir.name
+        # DirEntry carries the file type from the directory listing, and artifacts are read
+        # directly rather than checked with exists() first, so each file costs one syscall.
+        with os.scandir(figures_dir) as figure_entries:
+            figure_names = sorted(entry.name for entry in figure_entries if entry.is_dir())
+        for current_figure_id in figure_names:
+            figure_dir = figures_dir / current_figure_id
             plan_entry = plan_by_id.get(current_figure_id, {})
 
+            with os.scandir(figure_dir) as figure_entries:
+                iter_names = sorted(
+                    (entry.name for entry in figure_entries if entry.name.startswith("iter_") and entry.is_dir()),
+                    key=lambda name: int(name.split("_")[1]) if name.split("_")[1].isdigit() else 0,
+                )
             iter_reports = []
-            iter_dirs = sorted(
-                [p for p in figure_dir.glob("iter_*") if p.is_dir()],
-                key=lambda p: int(p.name.split("_")[1]) if "_" in p.name and p.name.split("_")[1].isdigit() else 0,
-            )
-            for iter_dir in iter_dirs:
-                critique_path = iter_dir / "critique.json"
-                if not critique_path.exists():
+            for iter_name in iter_names:
+                critique_path = figure_dir / iter_name / "critique.json"
+                try:
+                    report = loads(critique_path.read_bytes())
+                except FileNotFoundError:
                     summary["warnings"].append(f"Missing critique file: {critique_path}")
                     continue
-                report = json.loads(critique_path.read_text(encoding="utf-8"))
-                report["iteration"] = int(iter_dir.name.split("_")[1]) if "_" in iter_dir.name else 0
+                report["iteration"] = int(iter_name.split("_")[1])
                 iter_reports.append(report)
 
             last_report = iter_reports[-1] if iter_reports else {}
@@ -712,19 +895,22 @@ class Orchestrator:
 
             final_dir = figure_dir / "final"
             final_svg = final_dir / "figure.svg"
-            element_metadata_path = final_dir / "element_metadata.json"
-            traceability_path = final_dir / "traceability.json"
 
             total_elements = 0
             traced_elements = 0
 
-            if element_metadata_path.exists():
-                element_metadata = json.loads(element_metadata_path.read_text(encoding="utf-8"))
-                if isinstance(element_metadata, list):
-                    total_elements = len(element_metadata)
+            try:
+                element_metadata = loads((final_dir / "element_metadata.json").read_bytes())
+            except FileNotFoundError:
+                element_metadata = None
+            if isinstance(element_metadata, list):
+                total_elements = len(element_metadata)
 
-            if traceability_path.exists():
-                traceability = json.loads(traceability_path.read_text(encoding="utf-8"))
+            try:
+                traceability = loads((final_dir / "traceability.json").read_bytes())
+            except FileNotFoundError:
+                traceability = None
+            if traceability is not None:
                 trace_elements = traceability.get("elements", [])
                 if isinstance(trace_elements, list):
                     if total_elements == 0:
@@ -767,25 +953,12 @@ class Orchestrator:
             }
             figure_summaries.append(figure_summary)
 
-        if figure_id_filter:
-            figure_summaries = [item for item in figure_summaries if item.get("figure_id") == figure_id_filter]
-        if failures_only:
-            figure_summaries = [item for item in figure_summaries if not item.get("final_passed")]
-        if min_score is not None:
-            figure_summaries = [
-                item
-                for item in figure_summaries
-                if isinstance(item.get("final_score"), (int, float)) and item["final_score"] >= min_score
-            ]
-        if failed_dimension:
-            target = failed_dimension.strip().lower()
-            figure_summaries = [
-                item
-                for item in figure_summaries
-                if any(str(dim).lower() == target for dim in (item.get("failed_dimensions") or []))
-            ]
-
         summary["figures"] = figure_summaries
+        summary["aggregate"] = self._inspect_aggregate(figure_summaries)
+        return summary
+
+    @staticmethod
+    def _inspect_aggregate(figure_summaries: List[dict]) -> dict:
         accepted_count = sum(1 for item in figure_summaries if item.get("final_passed"))
         total_figures = len(figure_summaries)
         final_scores = [item["final_score"] for item in figure_summaries if isinstance(item.get("final_score"), (int, float))]
@@ -794,8 +967,7 @@ class Orchestrator:
             for item in figure_summaries
             if isinstance(item["traceability"].get("coverage"), (int, float))
         ]
-
-        summary["aggregate"] = {
+        return {
             "total_figures": total_figures,
             "accepted_count": accepted_count,
             "failed_count": total_figures - accepted_count,
@@ -804,7 +976,25 @@ class Orchestrator:
             "max_iterations_hit": [item["figure_id"] for item in figure_summaries if item.get("max_iterations_hit")],
         }
 
-        return summary
+    def _inspect_fingerprint(self, run_dir: Path) -> str:
+        entries = []
+        for name in ("run.json", "plan.json"):
+            try:
+                stat = os.stat(run_dir / name)
+            except FileNotFoundError:
+                continue
+            entries.append((name, stat.st_size, stat.st_mtime_ns))
+        # Directory mtimes are included so that added or removed (even empty) entries count.
+        for dirpath, _dirnames, filenames in os.walk(run_dir / "figures"):
+            for path in [dirpath] + [os.path.join(dirpath, name) for name in filenames]:
+                stat = os.stat(path)
+                entries.append((os.path.relpath(path, run_dir), stat.st_size, stat.st_mtime_ns))
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{run_dir}\0{self.max_iterations}\n".encode("utf-8"))
+        for rel_path, size, mtime_ns in sorted(entries):
+            digest.update(f"{rel_path}\0{size}\0{mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
 
     def inspect_html(self, run_id: str) -> Path:
         run_dir = self.run_root / run_id
@@ -818,7 +1008,7 @@ class Orchestrator:
         metadata = {
             "run_id": run_dir.name,
             "paper_path": str(paper_path),
-            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "created_at": utc_now_iso(),
             "max_iterations": self.max_iterations,
             "quality_threshold": self.quality_threshold,
             "dimension_threshold": self.dimension_threshold,
@@ -835,11 +1025,11 @@ class Orchestrator:
         self._write_json(run_dir / "run.json", metadata)
 
     def _write_sections(self, run_dir: Path, paper: PaperContent) -> None:
-        sections = {name: asdict(section) for name, section in paper.sections.items()}
-        self._write_json(run_dir / "sections.json", sections)
+        # write_indented serializes dataclasses itself, without asdict's recursive copy.
+        self._write_json(run_dir / "sections.json", dict(paper.sections))
 
     def _write_plan(self, run_dir: Path, plan: List[FigurePlan]) -> None:
-        self._write_json(run_dir / "plan.json", [asdict(item) for item in plan])
+        self._write_json(run_dir / "plan.json", list(plan))
 
     def _write_prompts(self, run_dir: Path) -> None:
         prompt_dir = run_dir / "prompts"
@@ -930,9 +1120,9 @@ class Orchestrator:
 
     @staticmethod
     def _append_contrib_log(path: Path, message: str) -> None:
-        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        timestamp = utc_now_iso()
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "a", encoding="utf-8") as handle:
+        with _CONTRIB_LOG_LOCK, open(path, "a", encoding="utf-8") as handle:
             handle.write(f"[{timestamp}] {message}\n")
 
     def _apply_contract_validation(self, report: CritiqueReport, errors: List[str]) -> None:
@@ -956,8 +1146,7 @@ class Orchestrator:
         return {template.template_id: template for template in catalog.templates}
 
     def _write_plugins_snapshot(self, run_dir: Path) -> None:
-        descriptors = [asdict(plugin) for plugin in list_plugins()]
-        self._write_json(run_dir / "plugins.json", descriptors)
+        self._write_json(run_dir / "plugins.json", list_plugins())
 
     def _write_journal_profile(self, run_dir: Path) -> None:
         if not self.journal_profile:
@@ -981,22 +1170,20 @@ class Orchestrator:
     def _write_style_refs(self, run_dir: Path, style_refs: dict) -> None:
         self._write_json(run_dir / "style_refs.json", style_refs)
 
-    def _write_inspect_snapshot(self, run_id: str) -> None:
+    def _write_inspect_snapshot(self, run_id: str) -> Dict[str, Any]:
         run_dir = self.run_root / run_id
-        snapshot = self.inspect(run_id)
-        self._write_json(run_dir / "inspect.json", snapshot)
-
-    def _load_or_build_inspect(self, run_id: str) -> Dict[str, Any]:
-        run_dir = self.run_root / run_id
-        inspect_path = run_dir / "inspect.json"
-        if inspect_path.exists():
-            data = self._read_json(inspect_path)
-            if isinstance(data, dict):
-                return data
+        fingerprint = self._inspect_fingerprint(run_dir)
         summary = self.inspect(run_id)
-        self._write_json(inspect_path, summary)
+        self._write_json(run_dir / "inspect.json", summary)
+        # Written after inspect.json so a matching fingerprint always describes a complete snapshot.
+        (run_dir / INSPECT_FINGERPRINT_FILE).write_text(fingerprint, encoding="utf-8")
         return summary
 
+    def _load_or_build_inspect(self, run_id: str) -> Dict[str, Any]:
+        if (self.run_root / run_id / "inspect.json").exists():
+            return self.inspect(run_id)
+        return self._write_inspect_snapshot(run_id)
+
     def _diff_figures(
         self,
         run_id_1: str,
@@ -1059,7 +1246,8 @@ class Orchestrator:
                 continue
             if not path_1.exists():
                 continue
-            if path_1.read_text(encoding="utf-8") != path_2.read_text(encoding="utf-8"):
+            # Unequal sizes short-circuit; otherwise bytes are compared chunk-wise without decoding.
+            if not filecmp.cmp(path_1, path_2, shallow=False):
                 changed.append(name)
         return changed
 
@@ -1069,6 +1257,19 @@ class Orchestrator:
             return None
         return float(right - left)
 
+    @staticmethod
+    def _promote(src: Path, dst: Path) -> None:
+        # Finalised artifacts are never rewritten in place, so final/ can share the iteration's
+        # inode instead of copying it. Exports stay real copies since they leave the run directory.
+        try:
+            dst.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
     @staticmethod
     def _file_hash(path: Path) -> Optional[str]:
         if not path.exists():
@@ -1082,7 +1283,7 @@ class Orchestrator:
         if not path.exists():
             return None
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return loads(path.read_bytes())
         except Exception:
             return None
 
@@ -1103,4 +1304,4 @@ class Orchestrator:
     @staticmethod
     def _write_json(path: Path, data: Dict[str, Any] | List[Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        write_indented(path, data)
@@ -7,4 +7,7 @@ __all__ = [
     "style_refs",
     "config",
     "structured_data",
+    "jsoncache",
+    "fastjson",
+    "timestamps",
 ]
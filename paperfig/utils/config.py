@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -44,14 +46,25 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     return result
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Any]:
+    del mtime_ns, size, inode
+    user_config = load_structured_file(Path(path_str))
+    if not isinstance(user_config, dict):
+        raise RuntimeError(f"Config file {path_str} must contain a mapping/object.")
+    return _deep_merge(DEFAULT_CONFIG, user_config)
+
+
 def load_config(config_path: Path = Path("paperfig.yaml")) -> Dict[str, Any]:
-    config = dict(DEFAULT_CONFIG)
-    if config_path.exists():
-        user_config = load_structured_file(config_path)
-        if not isinstance(user_config, dict):
-            raise RuntimeError(f"Config file {config_path} must contain a mapping/object.")
-        config = _deep_merge(config, user_config)
-    return config
+    """
+    Return DEFAULT_CONFIG merged with the config file, if present. The parsed file is reused
+    until it changes on disk, so the returned mapping is shared and must not be mutated.
+    """
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        return dict(DEFAULT_CONFIG)
+    return _load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
 
 def config_hash(config: Dict[str, Any]) -> str:
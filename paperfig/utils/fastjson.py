@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Files at least this large are memory-mapped for orjson rather than read into a bytes copy.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed, falling back to the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_path(path: Path) -> Any:
+    """Parse a JSON file from its raw bytes, skipping the decode-to-str step."""
+    with path.open("rb") as handle:
+        if orjson is not None and os.fstat(handle.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(handle.read())
+
+
+def _default(value: Any) -> Any:
+    # orjson serializes dataclass instances natively; give the stdlib encoder the same reach.
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_indented(data: Any) -> bytes:
+    """
+    Serialize to UTF-8 JSON with two-space indentation, matching json.dumps(indent=2)
+    layout. orjson writes non-ASCII characters verbatim instead of escaping them.
+    Dataclass instances are serialized as their field dicts.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=_default).encode("utf-8")
+
+
+def write_indented(path: Path, data: Any) -> None:
+    """
+    Write data as indented JSON. Without orjson the stdlib encoder streams chunks into
+    the file instead of materialising the whole document as one string first.
+    """
+    if orjson is not None:
+        path.write_bytes(dumps_indented(data))
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, default=_default)
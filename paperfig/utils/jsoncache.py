@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .fastjson import load_path
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int, inode: int) -> Any:
+    del mtime_ns, size, inode
+    return load_path(Path(path_str))
+
+
+def load_json_cached(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the parsed value while the file is unchanged.
+    Entries are keyed by path, mtime, size and inode, so rewritten artifacts are
+    re-parsed. The returned object is shared between callers and must be treated
+    as read-only.
+    """
+    stat = os.stat(path)
+    return _load_json_cached(str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def read_json_cached(path: Path) -> Any:
+    """Like load_json_cached, but returns None for missing or unparseable files."""
+    try:
+        return load_json_cached(path)
+    except Exception:
+        return None
+
+
+def clear_json_cache() -> None:
+    _load_json_cached.cache_clear()
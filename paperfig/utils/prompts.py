@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import resources
 
 
+@lru_cache(maxsize=64)
 def load_prompt(name: str) -> str:
+    # Packaged prompts are immutable at runtime, so each file is read once per process.
     prompt_file = resources.files("paperfig.prompts") / name
     return prompt_file.read_text(encoding="utf-8")
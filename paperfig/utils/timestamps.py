@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import time
+
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def utc_now_iso() -> str:
+    return time.strftime(ISO_UTC_FORMAT, time.gmtime())
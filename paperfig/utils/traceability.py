@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, asdict, field
+from pathlib import Path
 from typing import List, Dict, Any
 
+from .fastjson import dumps_indented
+
 
 @dataclass
 class SourceSpan:
@@ -53,5 +55,4 @@ def build_traceability(figure_id: str, elements: List[Dict[str, Any]]) -> Tracea
 
 
 def write_traceability(path: str, record: TraceabilityRecord) -> None:
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(record.to_dict(), handle, indent=2)
+    Path(path).write_bytes(dumps_indented(record.to_dict()))
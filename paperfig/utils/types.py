@@ -53,7 +53,7 @@ class CritiqueReport:
     passed: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchitectureCritiqueFinding:
     finding_id: str
     severity: str
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
+from unittest import mock
 
-from paperfig.agents.architecture_critic import ArchitectureCriticAgent
+from paperfig.agents.architecture_critic import ArchitectureCriticAgent, report_to_dict
 from paperfig.critique.rules import list_rule_descriptors
+from paperfig.templates.loader import load_template_catalog
 
 
 class ArchitectureCriticTests(unittest.TestCase):
@@ -23,6 +28,7 @@ class ArchitectureCriticTests(unittest.TestCase):
             self.assertTrue(report.blocked)
             ids = {item.finding_id for item in report.findings}
             self.assertIn("missing_plan", ids)
+            self.assertEqual(report_to_dict(report), asdict(report))
 
     def test_non_blocking_findings_when_only_minor_issues_present(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -42,6 +48,27 @@ class ArchitectureCriticTests(unittest.TestCase):
             severities = {item.severity for item in report.findings}
             self.assertIn("minor", severities)
 
+    def test_missing_flow_docs_lists_incomplete_folders(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            flows_root = repo_root / "docs" / "architecture" / "flows"
+            for name, files in {"b_flow": ["README.md"], "a_flow": [], "c_flow": ["README.md", "diagram.mermaid"]}.items():
+                (flows_root / name).mkdir(parents=True)
+                for filename in files:
+                    (flows_root / name / filename).write_text("x", encoding="utf-8")
+            (flows_root / "notes.txt").write_text("not a flow", encoding="utf-8")
+            run_dir = repo_root / "run-flows"
+            run_dir.mkdir()
+
+            report = ArchitectureCriticAgent(repo_root=repo_root).critique(
+                run_dir, enabled_rules=["missing_flow_docs"]
+            )
+            self.assertEqual(len(report.findings), 1)
+            self.assertEqual(
+                report.findings[0].evidence,
+                "a_flow: README.md, diagram.mermaid; b_flow: diagram.mermaid",
+            )
+
     def test_rule_listing_includes_expected_builtins(self) -> None:
         rules = {item["rule_id"] for item in list_rule_descriptors()}
         self.assertIn("missing_flow_docs", rules)
@@ -66,6 +93,42 @@ class ArchitectureCriticTests(unittest.TestCase):
             self.assertEqual(ids, {"traceability_gap"})
             self.assertFalse(report.blocked)
 
+    def test_template_catalog_not_loaded_when_no_rule_needs_it(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = Path(tmpdir) / "run-lazy"
+            run_dir.mkdir(parents=True, exist_ok=True)
+            (run_dir / "run.json").write_text(json.dumps({"template_pack": "expanded_v1"}), encoding="utf-8")
+
+            with mock.patch("paperfig.agents.architecture_critic.load_template_catalog") as loader:
+                ArchitectureCriticAgent().critique(run_dir, enabled_rules=["missing_plan"])
+            loader.assert_not_called()
+
+    def test_template_ids_are_shared_across_agents_until_pack_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template_dir = Path(tmpdir) / "flows"
+            shutil.copytree(Path("paperfig/templates/flows"), template_dir)
+            run_dir = Path(tmpdir) / "run-shared"
+            run_dir.mkdir()
+            (run_dir / "run.json").write_text(json.dumps({"template_pack": "expanded_v1"}), encoding="utf-8")
+            (run_dir / "plan.json").write_text(json.dumps([{"figure_id": "fig-a", "template_id": "unknown"}]), encoding="utf-8")
+
+            with mock.patch(
+                "paperfig.agents.architecture_critic.load_template_catalog", wraps=load_template_catalog
+            ) as loader:
+                for _ in range(2):
+                    ArchitectureCriticAgent(template_dir=template_dir).critique(
+                        run_dir, enabled_rules=["invalid_template_reference"]
+                    )
+                self.assertEqual(loader.call_count, 1)
+
+                template_file = sorted(template_dir.glob("*.yaml"))[0]
+                stat = template_file.stat()
+                os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                ArchitectureCriticAgent(template_dir=template_dir).critique(
+                    run_dir, enabled_rules=["invalid_template_reference"]
+                )
+                self.assertEqual(loader.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 import tempfile
 import types
 import unittest
@@ -61,18 +64,133 @@ class CliExtensionsTests(unittest.TestCase):
                 raise ImportError("missing")
             return types.SimpleNamespace(__name__=name)
 
+        from paperfig.cli import _import_error
+
+        # Import probes are memoized; clear them so the patched import is what doctor sees.
+        _import_error.cache_clear()
+        self.addCleanup(_import_error.cache_clear)
         with patch("paperfig.cli.importlib.import_module", side_effect=_fake_import):
             result = self.runner.invoke(app, ["doctor"])
 
         self.assertEqual(result.exit_code, 0, msg=result.stdout)
         self.assertIn("paperfig doctor --fix png", result.stdout)
 
+    def test_doctor_fix_png_verify_probes_cairosvg_once(self) -> None:
+        def _fake_import(name: str, *args, **kwargs):  # type: ignore[no-untyped-def]
+            del args, kwargs
+            if name == "cairosvg":
+                raise ImportError("missing")
+            return types.SimpleNamespace(__name__=name)
+
+        from paperfig.cli import _import_error
+
+        _import_error.cache_clear()
+        self.addCleanup(_import_error.cache_clear)
+        with patch("paperfig.cli.importlib.import_module", side_effect=_fake_import) as import_module:
+            result = self.runner.invoke(app, ["doctor", "--fix", "png", "--verify"])
+
+        self.assertEqual([c.args[0] for c in import_module.call_args_list].count("cairosvg"), 1)
+        self.assertEqual(result.exit_code, 0, msg=result.stdout)
+        self.assertIn("paperfig doctor --fix png", result.stdout)
+
+    def test_paperbanana_mode_restores_environment(self) -> None:
+        from paperfig.cli import _paperbanana_mode
+
+        with patch.dict("os.environ", {"PAPERFIG_MOCK_PAPERBANANA": "0"}):
+            with _paperbanana_mode("mock"):
+                self.assertEqual(os.environ["PAPERFIG_MOCK_PAPERBANANA"], "1")
+            self.assertEqual(os.environ["PAPERFIG_MOCK_PAPERBANANA"], "0")
+
+        with patch.dict("os.environ", {}, clear=True):
+            with _paperbanana_mode("real"):
+                self.assertEqual(os.environ["PAPERFIG_MOCK_PAPERBANANA"], "0")
+            self.assertNotIn("PAPERFIG_MOCK_PAPERBANANA", os.environ)
+            with _paperbanana_mode("auto"):
+                self.assertNotIn("PAPERFIG_MOCK_PAPERBANANA", os.environ)
+
+    def test_export_prints_report_warnings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_root = Path(tmpdir)
+            report_path = export_root / "export_report.json"
+            with patch("paperfig.pipeline.orchestrator.Orchestrator.export", return_value=export_root):
+                report_path.write_text(json.dumps({"figures": [], "warnings": []}, indent=2), encoding="utf-8")
+                result = self.runner.invoke(app, ["export", "run-1"])
+                self.assertEqual(result.exit_code, 0, msg=result.stdout)
+                self.assertNotIn("Warning:", result.stdout)
+
+                report_path.write_text(
+                    json.dumps({"figures": [], "warnings": ["PNG skipped"]}, indent=2),
+                    encoding="utf-8",
+                )
+                result = self.runner.invoke(app, ["export", "run-1"])
+                self.assertEqual(result.exit_code, 0, msg=result.stdout)
+                self.assertIn("Warning: PNG skipped", result.stdout)
+
+                # Compact output and a nested warnings key must not hide top-level warnings.
+                report_path.write_text(
+                    json.dumps(
+                        {"figures": [{"warnings": []}], "warnings": ["Contract invalid"]},
+                        separators=(",", ":"),
+                    ),
+                    encoding="utf-8",
+                )
+                result = self.runner.invoke(app, ["export", "run-1"])
+                self.assertEqual(result.exit_code, 0, msg=result.stdout)
+                self.assertIn("Warning: Contract invalid", result.stdout)
+
     def test_plugins_list(self) -> None:
         result = self.runner.invoke(app, ["plugins", "list"])
         self.assertEqual(result.exit_code, 0, msg=result.stdout)
         self.assertIn("critique_rule", result.stdout)
         self.assertIn("repro_check", result.stdout)
 
+    def test_import_does_not_load_pipeline(self) -> None:
+        probe = (
+            "import sys, paperfig.cli; "
+            "print(','.join(m for m in ('paperfig.pipeline.orchestrator', 'paperfig.lab.orchestrator') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_version_fast_path_skips_typer(self) -> None:
+        probe = (
+            "import atexit, sys; "
+            "atexit.register(lambda: print('typer' in sys.modules)); "
+            "sys.argv = ['paperfig', '--version']; "
+            "import paperfig.cli"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        from paperfig import __version__
+
+        self.assertEqual(result.stdout.splitlines(), [__version__, "False"])
+
+    def test_direct_invocation_attaches_only_the_named_group(self) -> None:
+        probe = (
+            "import sys; "
+            "sys.argv = ['paperfig', 'lab', 'status']; "
+            "import paperfig.cli as cli; "
+            "print(sorted(group.name for group in cli.app.registered_groups))"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "['lab']")
+
+    def test_command_catalog_matches_registered_commands(self) -> None:
+        from typer.main import get_command
+
+        from paperfig.command_catalog import COMMAND_CATALOG
+
+        root = get_command(app)
+        for entry in COMMAND_CATALOG:
+            group = root
+            for word in (part for part in entry.split() if not part.startswith("--")):
+                self.assertIn(word, group.commands, msg=entry)  # type: ignore[attr-defined]
+                group = group.commands[word]  # type: ignore[attr-defined]
+
+        result = self.runner.invoke(app, ["command-catalog"])
+        self.assertEqual(result.exit_code, 0, msg=result.stdout)
+        self.assertEqual(result.stdout.splitlines(), list(COMMAND_CATALOG))
+
     def test_plugins_validate(self) -> None:
         result = self.runner.invoke(app, ["plugins", "validate"])
         self.assertEqual(result.exit_code, 0, msg=result.stdout)
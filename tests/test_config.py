@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from paperfig.utils.config import DEFAULT_CONFIG, load_config
+
+
+class ConfigTests(unittest.TestCase):
+    def test_reuses_parsed_config_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "paperfig.yaml"
+            self.assertEqual(load_config(path), DEFAULT_CONFIG)
+
+            path.write_text("templates:\n  active_pack: journal_v1\n", encoding="utf-8")
+            first = load_config(path)
+            self.assertIs(load_config(path), first)
+            self.assertEqual(first["templates"]["active_pack"], "journal_v1")
+            self.assertEqual(first["templates"]["template_dir"], "paperfig/templates/flows")
+
+            path.write_text("templates:\n  active_pack: expanded_v2\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_config(path)["templates"]["active_pack"], "expanded_v2")
+
+    def test_non_mapping_config_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "paperfig.yaml"
+            path.write_text("- not\n- a mapping\n", encoding="utf-8")
+            with self.assertRaises(RuntimeError):
+                load_config(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
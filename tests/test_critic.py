@@ -4,7 +4,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from paperfig.agents.critic import CriticAgent
+from paperfig.agents.critic import _COUNTED_TAGS, _PRESENCE_TOKENS, _SVG_DIMENSION_FLOORS, CriticAgent
 from paperfig.utils.types import FigurePlan, PaperContent, PaperSection
 
 
@@ -52,6 +52,34 @@ class CriticTests(unittest.TestCase):
         self.assertEqual(report.dimension_threshold, 0.5)
         self.assertTrue(report.passed)
 
+    def test_crlf_svg_scores_like_its_lf_equivalent(self) -> None:
+        plan = FigurePlan(
+            figure_id="fig-crlf",
+            title="System",
+            kind="system_overview",
+            order=1,
+            abstraction_level="high",
+            description="System layout",
+            justification="Needed for architecture",
+        )
+        # About 8.9k characters with LF endings; the CRLF bytes are over the 9000 length bound.
+        lines = ["<svg viewBox='0 0 200 100' width='200' height='100'>"]
+        lines += [f"<!-- {'x' * 18} {index:03d} -->" for index in range(270)]
+        lines += ["<rect x='1' y='1' width='198' height='98'/>", "<text>é</text>", "</svg>"]
+        lf_text = "\n".join(lines)
+        self.assertLessEqual(len(lf_text), 9000)
+        self.assertGreater(len(lf_text.replace("\n", "\r\n").encode("utf-8")), 9000)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scores = {}
+            for newline in ("\n", "\r\n"):
+                path = Path(tmpdir) / "figure.svg"
+                path.write_bytes(lf_text.replace("\n", newline).encode("utf-8"))
+                report = CriticAgent().critique(path, plan, self._paper())
+                scores[newline] = report.quality_dimensions["conciseness"]
+        self.assertEqual(scores["\r\n"], scores["\n"])
+        self.assertEqual(CriticAgent._text_length(b"a\r\nb\rc\n"), len("a\nb\nc\n"))
+
     def test_dimension_gate_can_fail_even_with_low_threshold(self) -> None:
         plan = FigurePlan(
             figure_id="fig-2",
@@ -72,6 +100,45 @@ class CriticTests(unittest.TestCase):
         self.assertFalse(report.passed)
         self.assertGreaterEqual(len(report.failed_dimensions), 1)
 
+    def test_short_circuit_skips_svg_when_faithfulness_cannot_pass(self) -> None:
+        plan = FigurePlan(
+            figure_id="fig-3",
+            title="Weak",
+            kind="summary",
+            order=1,
+            abstraction_level="low",
+            description="short",
+            justification="test",
+            source_spans=[],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # The SVG is never read, so a missing file must not raise.
+            path = Path(tmpdir) / "missing.svg"
+            report = CriticAgent(threshold=0.1, dimension_threshold=0.5, short_circuit=True).critique(
+                path, plan, self._paper()
+            )
+
+        self.assertFalse(report.passed)
+        self.assertEqual(report.failed_dimensions, ["faithfulness"])
+        self.assertEqual(len(report.issues), 2)
+        self.assertTrue(any(issue.startswith("SVG scan skipped") for issue in report.issues))
+        self.assertFalse(any("Readability" in issue or "Aesthetics" in issue for issue in report.issues))
+        self.assertEqual(
+            set(report.quality_dimensions),
+            {"faithfulness", "readability", "conciseness", "aesthetics"},
+        )
+
+    def test_short_circuit_floors_match_lowest_full_scan_scores(self) -> None:
+        critic = CriticAgent()
+        # No text, primitives or presentation attributes; too long and too many primitives.
+        counts = {tag: 0 for tag in _COUNTED_TAGS}
+        counts.update({token: 0 for token in _PRESENCE_TOKENS})
+        self.assertAlmostEqual(critic._score_readability(counts), _SVG_DIMENSION_FLOORS["readability"])
+        self.assertAlmostEqual(critic._score_aesthetics(counts), _SVG_DIMENSION_FLOORS["aesthetics"])
+        counts[b"<rect"] = 200
+        self.assertAlmostEqual(critic._score_conciseness(counts, 20000), _SVG_DIMENSION_FLOORS["conciseness"])
+
 
 if __name__ == "__main__":
     unittest.main()
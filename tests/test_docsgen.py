@@ -4,6 +4,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from paperfig.docsgen.drift import run_docs_regeneration
 
@@ -62,6 +63,91 @@ class DocsGenTests(unittest.TestCase):
             )
             self.assertFalse(clean_report["drift_detected"])
 
+    def test_shared_blocks_render_once_per_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            body = "<!-- AUTO-GEN:START shared -->\nstale\n<!-- AUTO-GEN:END shared -->\n"
+            for name in ("A.md", "B.md"):
+                (root / name).write_text(body, encoding="utf-8")
+            manifest = {
+                "documents": [{"path": "A.md", "mode": "hybrid"}, {"path": "B.md", "mode": "generated"}],
+                "auto_blocks": {"shared": {"type": "static", "content": "fresh"}},
+            }
+            manifest_path = root / "docs_manifest.yaml"
+            manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+            from paperfig.docsgen import renderer
+
+            with mock.patch.object(renderer, "render_auto_block", wraps=renderer.render_auto_block) as render:
+                report = run_docs_regeneration(manifest_path=manifest_path, check_only=False, repo_root=root)
+
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual([doc["written"] for doc in report["documents"]], [True, True])
+            for name in ("A.md", "B.md"):
+                self.assertIn("\nfresh\n", (root / name).read_text(encoding="utf-8"))
+
+    def test_missing_document_is_reported_as_drift(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            manifest_path = root / "docs_manifest.yaml"
+            manifest_path.write_text(
+                json.dumps({"documents": [{"path": "MISSING.md", "mode": "validated"}]}),
+                encoding="utf-8",
+            )
+
+            report = run_docs_regeneration(manifest_path=manifest_path, check_only=True, repo_root=root)
+
+            self.assertTrue(report["drift_detected"])
+            self.assertFalse(report["documents"][0]["exists"])
+            self.assertEqual(report["documents"][0]["error"], "document_missing")
+
+    def test_undecodable_document_is_reported_as_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            manifest_path = root / "docs_manifest.yaml"
+            manifest_path.write_text(
+                json.dumps({"documents": [{"path": "BINARY.md", "mode": "validated"}]}),
+                encoding="utf-8",
+            )
+            (root / "BINARY.md").write_bytes(b"\xff\xfe not utf-8")
+
+            report = run_docs_regeneration(manifest_path=manifest_path, check_only=True, repo_root=root)
+
+            self.assertTrue(report["drift_detected"])
+            self.assertTrue(report["documents"][0]["exists"])
+            self.assertIn("utf-8", report["documents"][0]["error"])
+
+    def test_template_catalog_block_reloads_only_after_pack_changes(self) -> None:
+        from paperfig.docsgen import renderer
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template_dir = Path(tmpdir)
+            config = {"type": "flow_template_catalog", "template_dir": str(template_dir)}
+            (template_dir / "a.yaml").write_text("{}", encoding="utf-8")
+            with mock.patch.object(renderer, "load_template_catalog") as loader:
+                loader.return_value.templates = []
+                renderer.render_auto_block("catalog", config, Path("."))
+                renderer.render_auto_block("catalog", config, Path("."))
+                self.assertEqual(loader.call_count, 1)
+
+                (template_dir / "b.yaml").write_text("{}", encoding="utf-8")
+                renderer.render_auto_block("catalog", config, Path("."))
+                self.assertEqual(loader.call_count, 2)
+
+    def test_block_scanner_matches_reference_regex(self) -> None:
+        from paperfig.docsgen.renderer import AUTO_BLOCK_RE, iter_auto_blocks
+
+        samples = [
+            "<!-- AUTO-GEN:START a -->x<!--AUTO-GEN:END a-->",
+            "<!-- AUTO-GEN:START a -->open <!-- AUTO-GEN:START b-->y<!--  AUTO-GEN:END  b  -->",
+            "<!-- AUTO-GEN:START a-->1<!-- AUTO-GEN:START b -->2<!-- AUTO-GEN:END b --><!-- AUTO-GEN:END a -->",
+            "<!-- AUTO-GEN:START ab-->z<!-- AUTO-GEN:END a --><!-- AUTO-GEN:END ab -->",
+            "<!-- AUTO-GEN:START -->none",
+        ]
+        for text in samples:
+            expected = [(m.start(), m.end(), m.group("block_id")) for m in AUTO_BLOCK_RE.finditer(text)]
+            self.assertEqual(list(iter_auto_blocks(text)), expected, msg=text)
+
 
 if __name__ == "__main__":
     unittest.main()
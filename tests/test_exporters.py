@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from paperfig.exporters.latex import export_latex, latex_escape
+
+
+class ExporterTests(unittest.TestCase):
+    def test_latex_escape_handles_specials_in_one_pass(self) -> None:
+        self.assertEqual(latex_escape("Loss & Accuracy (50%)"), r"Loss \& Accuracy (50\%)")
+        self.assertEqual(latex_escape(r"a\b_{c}"), r"a\textbackslash{}b\_\{c\}")
+
+    def test_export_latex_escapes_caption_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "fig-1.tex"
+            export_latex("fig-1", "fig-1.svg", "Results #1", output_path)
+            snippet = output_path.read_text(encoding="utf-8")
+        self.assertIn("\\caption{Results \\#1}\n", snippet)
+        self.assertIn("\\includegraphics[width=\\linewidth]{fig-1.svg}\n", snippet)
+        self.assertIn("\\label{fig:fig-1}\n", snippet)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+from unittest import mock
+
+from paperfig.utils import fastjson
+
+
+@dataclass
+class _Report:
+    figure_id: str
+    scores: Dict[str, float] = field(default_factory=dict)
+    issues: List[str] = field(default_factory=list)
+
+
+class FastJsonTests(unittest.TestCase):
+    def test_write_indented_matches_stdlib_layout(self) -> None:
+        payload = {"run_id": "run-1", "figures": [{"figure_id": "fig-1", "score": 0.75}], "warnings": []}
+        expected = json.dumps(payload, indent=2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for orjson_module in (fastjson.orjson, None):
+                with mock.patch.object(fastjson, "orjson", orjson_module):
+                    path = Path(tmpdir) / "summary.json"
+                    fastjson.write_indented(path, payload)
+                    self.assertEqual(path.read_text(encoding="utf-8"), expected)
+                    self.assertEqual(fastjson.loads(path.read_bytes()), payload)
+
+    def test_dumps_indented_serializes_dataclasses(self) -> None:
+        report = _Report(figure_id="fig-1", scores={"readability": 0.5}, issues=["dense"])
+        expected = {"figure_id": "fig-1", "scores": {"readability": 0.5}, "issues": ["dense"]}
+        for orjson_module in (fastjson.orjson, None):
+            with mock.patch.object(fastjson, "orjson", orjson_module):
+                self.assertEqual(json.loads(fastjson.dumps_indented(report)), expected)
+
+    def test_load_path_memory_maps_large_files(self) -> None:
+        payload = {"figures": [{"figure_id": f"fig-{index}", "notes": "x" * 64} for index in range(64)]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "inspect.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            for orjson_module in (fastjson.orjson, None):
+                with mock.patch.object(fastjson, "orjson", orjson_module), mock.patch.object(
+                    fastjson, "_MMAP_THRESHOLD", 1024
+                ):
+                    self.assertEqual(fastjson.load_path(path), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
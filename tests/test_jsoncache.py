@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from paperfig.utils.jsoncache import load_json_cached, read_json_cached
+
+
+class JsonCacheTests(unittest.TestCase):
+    def test_reuses_parsed_value_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "run.json"
+            path.write_text(json.dumps({"seed": 1}), encoding="utf-8")
+
+            first = load_json_cached(path)
+            self.assertIs(load_json_cached(path), first)
+
+            path.write_text(json.dumps({"seed": 22}), encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_json_cached(path), {"seed": 22})
+
+    def test_read_json_cached_returns_none_for_missing_or_invalid(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing.json"
+            invalid = Path(tmpdir) / "invalid.json"
+            invalid.write_text("{not json", encoding="utf-8")
+
+            self.assertIsNone(read_json_cached(missing))
+            self.assertIsNone(read_json_cached(invalid))
+
+
+if __name__ == "__main__":
+    unittest.main()
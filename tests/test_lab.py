@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import json
 import tempfile
+import time
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 
-from paperfig.lab.orchestrator import LabOrchestrator
+from paperfig.lab.agents.executor import OUTPUT_CAPTURE_LIMIT, execute_command
+from paperfig.lab.orchestrator import LabOrchestrator, result_to_dict, spec_to_dict
 from paperfig.lab.policy import is_command_allowed, load_policy
+from paperfig.lab.types import LabPolicy
 from paperfig.utils.structured_data import dump_structured_data, load_structured_file
 
 
@@ -39,6 +43,65 @@ class LabTests(unittest.TestCase):
             self.assertFalse(blocked)
             self.assertIn("blocked", reason.lower())
 
+    def test_policy_reports_the_original_blocked_pattern(self) -> None:
+        policy = LabPolicy(blocked_patterns=["curl", "RM -RF", "rm"])
+
+        blocked, reason = is_command_allowed("echo ok && rm -rf /tmp/x", policy)
+        self.assertFalse(blocked)
+        self.assertEqual(reason, "Command blocked by pattern: RM -RF")
+
+        allowed, _ = is_command_allowed("echo ok", policy)
+        self.assertTrue(allowed)
+
+    def test_policy_prefix_fast_path_matches_tokenized_check(self) -> None:
+        policy = LabPolicy(allowed_prefixes=frozenset({"python3", "echo"}))
+        cases = {
+            "python3 -m unittest": (True, "allowed"),
+            "echo": (True, "allowed"),
+            "'echo' hi": (True, "allowed"),
+            "python -m unittest": (True, "allowed (python alias for python3)"),
+            "python3x -c 1": (False, "Command prefix 'python3x' is not allowed"),
+            "   ": (False, "Command is empty"),
+        }
+        for command, expected in cases.items():
+            self.assertEqual(is_command_allowed(command, policy), expected, msg=command)
+
+    def test_policy_fast_path_keeps_tokenized_edge_cases(self) -> None:
+        multi_word = LabPolicy(allowed_prefixes=frozenset({"git status"}))
+        self.assertEqual(
+            is_command_allowed("git status -s", multi_word),
+            (False, "Command prefix 'git' is not allowed"),
+        )
+
+        policy = LabPolicy(allowed_prefixes=frozenset({"python3"}))
+        with self.assertRaises(ValueError):
+            is_command_allowed('python3 "unterminated', policy)
+
+    def test_executor_caps_captured_output(self) -> None:
+        policy = LabPolicy(allowed_prefixes=frozenset({"python3"}), max_runtime_seconds=60)
+        command = "python3 -c \"import sys; sys.stdout.write('x' * 50000); sys.stderr.write('e' * 20)\""
+
+        result = execute_command(command, policy)
+
+        self.assertEqual(result.status, "completed")
+        self.assertEqual(result.stdout, "x" * OUTPUT_CAPTURE_LIMIT)
+        self.assertEqual(result.stderr, "e" * 20)
+
+    def test_executor_timeout_covers_background_process_holding_output(self) -> None:
+        policy = LabPolicy(allowed_prefixes=frozenset({"python3"}), max_runtime_seconds=1)
+        command = (
+            "python3 -c \"import subprocess, sys; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(6)'])\""
+        )
+
+        started = time.monotonic()
+        result = execute_command(command, policy)
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(result.status, "failed")
+        self.assertEqual(result.return_code, 124)
+        self.assertEqual(result.policy_violation, "execution_timeout")
+
     def test_lab_orchestrator_propose_run_review_status(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -63,7 +126,10 @@ class LabTests(unittest.TestCase):
             spec_data["command"] = "python3 -c \"print('lab-ok')\""
             (exp_dir / "spec.yaml").write_text(dump_structured_data(spec_data, as_yaml=True), encoding="utf-8")
 
+            self.assertEqual(spec_to_dict(spec), asdict(spec))
+
             result = orchestrator.run(spec.experiment_id, lab_run_id=lab_run_id)
+            self.assertEqual(result_to_dict(result), asdict(result))
             self.assertEqual(result.status, "completed")
             self.assertEqual(result.return_code, 0)
             self.assertTrue((exp_dir / "execution_log.json").exists())
@@ -7,7 +7,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from paperfig.pipeline.orchestrator import Orchestrator
+from paperfig.pipeline.orchestrator import Orchestrator, _load_plan
 from paperfig.journals.loader import load_journal_profile
 from paperfig.utils.types import CritiqueReport, FigureCandidate, FigurePlan
 
@@ -207,6 +207,53 @@ Performance rises from 0.80 to 0.87.
             plan = json.loads((run_dir / "plan.json").read_text(encoding="utf-8"))
             self.assertGreaterEqual(len(plan), 1)
 
+    def test_parallel_figure_workers_match_serial_outputs(self) -> None:
+        content = """
+# Title
+
+## Methodology
+Method details.
+
+## System
+System details.
+
+## Results
+Result details.
+""".strip()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            paper = tmp / "paper.md"
+            paper.write_text(content, encoding="utf-8")
+            config_path = tmp / "paperfig.yaml"
+            config_path.write_text(json.dumps({"parallelism": {"figure_workers": 4}}), encoding="utf-8")
+
+            with patch.dict(os.environ, {"PAPERFIG_MOCK_PAPERBANANA": "1"}):
+                serial = Orchestrator(run_root=tmp / "serial")
+                parallel = Orchestrator(run_root=tmp / "parallel", config_path=config_path)
+                self.assertEqual(parallel.figure_workers, 4)
+                serial_run = serial.generate(paper, contrib=True)
+                parallel_run = parallel.generate(paper, contrib=True)
+
+            serial_dir = tmp / "serial" / serial_run
+            parallel_dir = tmp / "parallel" / parallel_run
+            def _caption_titles(run_dir: Path) -> list:
+                lines = (run_dir / "captions.txt").read_text(encoding="utf-8").splitlines()
+                return [line.split(": ", 1)[1] for line in lines]
+
+            self.assertEqual(_caption_titles(serial_dir), _caption_titles(parallel_dir))
+            plan_ids = [item["figure_id"] for item in json.loads((parallel_dir / "plan.json").read_text(encoding="utf-8"))]
+            caption_ids = [
+                line.split(": ", 1)[0]
+                for line in (parallel_dir / "captions.txt").read_text(encoding="utf-8").splitlines()
+            ]
+            self.assertEqual(caption_ids, plan_ids)
+            serial_figures = json.loads((serial_dir / "traceability.json").read_text(encoding="utf-8"))["figures"]
+            parallel_figures = json.loads((parallel_dir / "traceability.json").read_text(encoding="utf-8"))["figures"]
+            self.assertEqual(len(serial_figures), len(parallel_figures))
+            log_lines = (parallel_dir / "contrib.log").read_text(encoding="utf-8").splitlines()
+            self.assertTrue(all(line.startswith("[") for line in log_lines))
+
     def test_export_writes_report_and_assets(self) -> None:
         content = """
 # Title
@@ -243,7 +290,7 @@ Result details.
                 png_path.parent.mkdir(parents=True, exist_ok=True)
                 png_path.write_bytes(b"\x89PNG\r\n\x1a\n")
 
-            with patch("paperfig.pipeline.orchestrator.export_png", _fake_export_png):
+            with patch("paperfig.exporters.png.export_png", _fake_export_png):
                 out = orchestrator.export(run_id)
 
             self.assertTrue((out / "export_report.json").exists())
@@ -257,6 +304,16 @@ Result details.
             self.assertTrue((out / "traceability.json").exists())
             self.assertTrue((out / "captions.txt").exists())
 
+            orchestrator.export_workers = 4
+            with patch("paperfig.exporters.png.export_png", _fake_export_png):
+                threaded_out = orchestrator.export(run_id, output_dir=tmp / "threaded")
+            threaded = json.loads((threaded_out / "export_report.json").read_text(encoding="utf-8"))
+            self.assertEqual(
+                [(item["figure_id"], item["contract_valid"]) for item in threaded["figures"]],
+                [(item["figure_id"], item["contract_valid"]) for item in report["figures"]],
+            )
+            self.assertEqual(threaded["warnings"], report["warnings"])
+
     def test_iteration_passes_critique_feedback_to_next_generation(self) -> None:
         content = """
 # Title
@@ -340,6 +397,126 @@ Result details.
             failures_only = orchestrator.inspect(run_id, failures_only=True)
             self.assertLessEqual(failures_only["aggregate"]["total_figures"], summary["aggregate"]["total_figures"])
 
+    def test_inspect_reuses_snapshot_until_run_files_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            paper = tmp / "paper.md"
+            runs = tmp / "runs"
+            paper.write_text("# Title\n\n## Methodology\nMethod details.", encoding="utf-8")
+
+            old_mock = os.environ.get("PAPERFIG_MOCK_PAPERBANANA")
+            os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "1"
+            try:
+                orchestrator = Orchestrator(run_root=runs)
+                run_id = orchestrator.generate(paper)
+            finally:
+                if old_mock is None:
+                    os.environ.pop("PAPERFIG_MOCK_PAPERBANANA", None)
+                else:
+                    os.environ["PAPERFIG_MOCK_PAPERBANANA"] = old_mock
+
+            inspect_path = runs / run_id / "inspect.json"
+            snapshot = json.loads(inspect_path.read_text(encoding="utf-8"))
+            self.assertNotIn("fingerprint", snapshot)
+            self.assertGreaterEqual(snapshot["aggregate"]["total_figures"], 1)
+            snapshot_bytes = inspect_path.read_bytes()
+
+            with patch.object(Orchestrator, "_collect_inspect", wraps=orchestrator._collect_inspect) as collect:
+                first = orchestrator.inspect(run_id)
+                collect.assert_not_called()
+                self.assertEqual(first, snapshot)
+
+                figure_id = first["figures"][0]["figure_id"]
+                critique_path = sorted((runs / run_id / "figures" / figure_id).glob("iter_*/critique.json"))[-1]
+                report = json.loads(critique_path.read_text(encoding="utf-8"))
+                report["score"] = 0.123456
+                critique_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+                second = orchestrator.inspect(run_id, figure_id=figure_id)
+                self.assertEqual(collect.call_count, 1)
+            self.assertEqual(second["figures"][0]["final_score"], 0.123456)
+            # inspect() is read-only; only generation persists the snapshot.
+            self.assertEqual(inspect_path.read_bytes(), snapshot_bytes)
+
+    @unittest.skipUnless(os.name == "posix", "hardlink inode check is POSIX-specific")
+    def test_final_artifacts_are_hardlinked_to_accepted_iteration(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            paper = tmp / "paper.md"
+            runs = tmp / "runs"
+            paper.write_text("# Title\n\n## Methodology\nMethod details.", encoding="utf-8")
+
+            old_mock = os.environ.get("PAPERFIG_MOCK_PAPERBANANA")
+            os.environ["PAPERFIG_MOCK_PAPERBANANA"] = "1"
+            try:
+                orchestrator = Orchestrator(run_root=runs)
+                run_id = orchestrator.generate(paper)
+            finally:
+                if old_mock is None:
+                    os.environ.pop("PAPERFIG_MOCK_PAPERBANANA", None)
+                else:
+                    os.environ["PAPERFIG_MOCK_PAPERBANANA"] = old_mock
+
+            summary = orchestrator.inspect(run_id)
+            figure = summary["figures"][0]
+            figure_dir = runs / run_id / "figures" / figure["figure_id"]
+            iter_dir = figure_dir / f"iter_{figure['iterations_attempted']}"
+            for name in ("figure.svg", "element_metadata.json", "traceability.json"):
+                self.assertEqual(
+                    (figure_dir / "final" / name).stat().st_ino,
+                    (iter_dir / name).stat().st_ino,
+                )
+
+    def test_agents_are_not_built_until_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("paperfig.pipeline.orchestrator.PlannerAgent") as planner_cls, patch(
+                "paperfig.pipeline.orchestrator.CriticAgent"
+            ) as critic_cls:
+                orchestrator = Orchestrator(run_root=Path(tmpdir))
+                planner_cls.assert_not_called()
+                critic_cls.assert_not_called()
+                self.assertIs(orchestrator.planner, orchestrator.planner)
+                planner_cls.assert_called_once()
+
+    def test_critic_short_circuit_is_read_from_config(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            config_path = tmp / "paperfig.yaml"
+            config_path.write_text(json.dumps({"critic": {"short_circuit": True}}), encoding="utf-8")
+            self.assertFalse(Orchestrator(run_root=tmp / "runs").critic.short_circuit)
+            self.assertTrue(Orchestrator(run_root=tmp / "runs", config_path=config_path).critic.short_circuit)
+
+    def test_plan_is_parsed_once_until_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = Path(tmpdir) / "run-plan"
+            run_dir.mkdir()
+            self.assertIsNone(_load_plan(run_dir))
+
+            plan_path = run_dir / "plan.json"
+            plan_path.write_text(json.dumps([{"figure_id": "fig-a", "title": "A"}]), encoding="utf-8")
+            first = _load_plan(run_dir)
+            self.assertIs(_load_plan(run_dir), first)
+            self.assertEqual(first[1]["fig-a"]["title"], "A")
+
+            plan_path.write_text(json.dumps([{"figure_id": "fig-b", "title": "Longer title"}]), encoding="utf-8")
+            second = _load_plan(run_dir)
+            self.assertIsNot(second, first)
+            self.assertEqual(list(second[1]), ["fig-b"])
+
+    def test_plan_index_skips_malformed_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = Path(tmpdir) / "run-plan"
+            run_dir.mkdir()
+            plan_path = run_dir / "plan.json"
+            plan_path.write_text(json.dumps(["stray", {"title": "no id"}, {"figure_id": "fig-a"}]), encoding="utf-8")
+            entries, by_id = _load_plan(run_dir)
+            self.assertEqual(len(entries), 3)
+            self.assertEqual(list(by_id), ["fig-a"])
+
+            plan_path.write_text(json.dumps({"figure_id": "fig-a"}), encoding="utf-8")
+            with self.assertRaises(ValueError):
+                _load_plan(run_dir)
+
     def test_inspect_filters_by_min_score_and_failed_dimension(self) -> None:
         content = """
 # Title
@@ -386,6 +563,52 @@ Result details.
             for figure in aesthetics_failed["figures"]:
                 self.assertIn("aesthetics", [dim.lower() for dim in figure["failed_dimensions"]])
 
+    def test_iteration_early_exit_stops_on_score_plateau(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            paper = tmp / "paper.md"
+            paper.write_text("# Title\n\n## Methodology\nMethod details.\n\n## Results\nResult details.", encoding="utf-8")
+            config_path = tmp / "paperfig.yaml"
+            config_path.write_text(json.dumps({"iteration_early_exit": {"patience": 1}}), encoding="utf-8")
+
+            with patch.dict(os.environ, {"PAPERFIG_MOCK_PAPERBANANA": "1"}):
+                orchestrator = Orchestrator(run_root=tmp / "runs", max_iterations=3, config_path=config_path)
+                orchestrator.planner = _TwoFigurePlanner()  # type: ignore[assignment]
+                orchestrator.critic = _VariedCritic()  # type: ignore[assignment]
+                run_id = orchestrator.generate(paper)
+
+            summary = orchestrator.inspect(run_id)
+            failing = [item for item in summary["figures"] if not item["final_passed"]]
+            self.assertEqual(len(failing), 1)
+            self.assertEqual(failing[0]["iterations_attempted"], 2)
+            self.assertIsNotNone(failing[0]["final_svg_path"])
+            self.assertFalse((tmp / "runs" / run_id / "figures" / failing[0]["figure_id"] / "iter_3").exists())
+
+    def test_failed_figure_leaves_no_partial_captions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            paper = tmp / "paper.md"
+            runs = tmp / "runs"
+            paper.write_text("# Title\n\n## Methodology\nMethod details.\n\n## Results\nResult details.", encoding="utf-8")
+
+            class _FailsOnSecondFigure(_RecordingGenerator):
+                def generate(self, plan, *args, **kwargs):
+                    if plan.order > 1:
+                        raise RuntimeError("generator failed")
+                    return super().generate(plan, *args, **kwargs)
+
+            with patch.dict(os.environ, {"PAPERFIG_MOCK_PAPERBANANA": "1"}):
+                orchestrator = Orchestrator(run_root=runs)
+                orchestrator.planner = _TwoFigurePlanner()  # type: ignore[assignment]
+                orchestrator.critic = _VariedCritic()  # type: ignore[assignment]
+                orchestrator.generator = _FailsOnSecondFigure()  # type: ignore[assignment]
+                with self.assertRaises(RuntimeError):
+                    orchestrator.generate(paper)
+
+            run_dir = next(runs.iterdir())
+            self.assertFalse((run_dir / "captions.txt").exists())
+            self.assertFalse((run_dir / "captions.txt.tmp").exists())
+
     def test_export_warning_includes_doctor_fix_hint_when_png_skipped(self) -> None:
         content = """
 # Title
@@ -421,7 +644,7 @@ Result details.
                 del svg_path, png_path
                 raise RuntimeError("cairosvg is required for PNG export. Run: paperfig doctor --fix png")
 
-            with patch("paperfig.pipeline.orchestrator.export_png", _fake_fail_png):
+            with patch("paperfig.exporters.png.export_png", _fake_fail_png):
                 out = orchestrator.export(run_id)
 
             report = json.loads((out / "export_report.json").read_text(encoding="utf-8"))
@@ -476,6 +699,8 @@ Result details.
             self.assertIn("metrics", diff_report)
             self.assertIn("changed_figures", diff_report)
             self.assertIn("changed_artifacts", diff_report)
+            self.assertIn("run.json", diff_report["changed_artifacts"])
+            self.assertNotIn("plan.json", diff_report["changed_artifacts"])
 
     def test_inspect_html_writes_manifest(self) -> None:
         content = """
@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 
-from paperfig.audits.reproducibility import run_reproducibility_audit
+from paperfig.audits.repro_checks import scan_run_artifacts
+from paperfig.audits.reproducibility import report_to_dict, run_reproducibility_audit
 from paperfig.utils.config import config_hash, load_config
 
 
@@ -47,6 +49,7 @@ class ReproAuditTests(unittest.TestCase):
             report = run_reproducibility_audit(run_dir, mode="soft", expected_config_hash=cfg_hash)
             self.assertTrue(report.passed)
             self.assertEqual(report.mode, "soft")
+            self.assertEqual(report_to_dict(report), asdict(report))
 
     def test_repro_audit_fails_when_required_artifact_missing(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -59,6 +62,22 @@ class ReproAuditTests(unittest.TestCase):
             failed_required = [check for check in report.checks if check.required and not check.passed]
             self.assertGreaterEqual(len(failed_required), 1)
 
+    def test_scan_run_artifacts_lists_prompts_with_prefix(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = Path(tmpdir) / "run-c"
+            self._build_complete_run(run_dir)
+            (run_dir / "prompts" / "critique_figure.txt").unlink()
+
+            present = scan_run_artifacts(run_dir)
+            self.assertIn("run.json", present)
+            self.assertIn("prompts/plan_figure.txt", present)
+            self.assertNotIn("prompts/critique_figure.txt", present)
+            self.assertEqual(scan_run_artifacts(Path(tmpdir) / "missing"), set())
+
+            report = run_reproducibility_audit(run_dir, mode="soft")
+            failed = {check.check_id for check in report.checks if not check.passed}
+            self.assertIn("artifact_prompts_critique_figure.txt", failed)
+
 
 if __name__ == "__main__":
     unittest.main()